@@ -0,0 +1,195 @@
+from typing import Iterator, Tuple, Dict, Union, List, Sequence
+import os
+import collections
+import itertools
+import numpy as np
+from graph import Graph, CSRGraph, Vertex, bellman_ford, dijkstra
+from shared_arrays import (
+    SharedArrays,
+    get_context,
+    init_worker,
+    get_worker_state,
+)
+
+
+def johnson(
+    graph: Graph, workers: int = None, chunksize: int = 1
+) -> Iterator[Tuple[Vertex, Dict[Vertex, Union[int, float]]]]:
+    """Johnson's all-pairs shortest path algorithm. Edges may have negative
+    weight when there is no negative cycle.
+
+    Bellman-Ford algorithm from a virtual vertex, which has zero weight edges
+    to all vertices, gives a potential h(v) for each vertex. Edges reweighted
+    by w(u, v) + h(u) - h(v) are non-negative and shortest paths are
+    unchanged, so Dijkstra's algorithm is run from every vertex. Runs of
+    Dijkstra's algorithm are distributed to a pool of `workers` processes,
+    which attach the reweighted graph in shared memory when they start.
+
+    Yield (source, distance) for each source vertex,
+          where distance = {v: distance from the source} for v ∈ V.
+          Only one row is held in memory at a time.
+
+    Raise RuntimeError
+          when the graph has negative cycle(s).
+
+    Complexity: O(|V|⋅|E| lg |V|)
+    """
+    if isinstance(graph, CSRGraph):
+        csr, labels = graph, graph.get_vertices()
+    else:
+        csr = graph.to_csr()
+        labels = csr.labels
+    potential = __compute_potential(csr)
+    sources, dests, weights = csr.get_edge_arrays()
+    # Clip rounding errors, reweighted edges are non-negative in theory.
+    reweighted = np.maximum(weights + potential[sources] - potential[dests], 0)
+    reweighted_csr = CSRGraph(csr.indptr, csr.indices, reweighted)
+
+    if workers is None:
+        workers = os.cpu_count()
+    source_ids = range(csr.num_vertices)
+    if workers == 1:
+        for source_id in source_ids:
+            row = __shortest_path_row(reweighted_csr, potential, source_id)
+            yield labels[source_id], dict(zip(labels, row.tolist()))
+        return
+
+    n = csr.num_vertices
+    chunks = (
+        range(start, min(start + chunksize, n))
+        for start in range(0, n, chunksize)
+    )
+    arrays = {
+        "indptr": csr.indptr,
+        "indices": csr.indices,
+        "weights": reweighted_csr.weights,
+        "potential": potential,
+    }
+    with SharedArrays.create(arrays) as shared, get_context().Pool(
+        workers,
+        initializer=init_worker,
+        initargs=(shared.specs, __build_state),
+    ) as pool:
+
+        def submit(chunk: range) -> None:
+            result = pool.apply_async(__shortest_path_rows, (chunk,))
+            pending.append((chunk, result))
+
+        pending = collections.deque()  # Tasks in flight in order of sources
+        for chunk in itertools.islice(chunks, 2 * workers):
+            submit(chunk)
+        while pending:
+            chunk, result = pending.popleft()
+            rows = result.get()
+            for next_chunk in itertools.islice(chunks, 1):
+                submit(next_chunk)
+            for source_id, row in zip(chunk, rows):
+                yield labels[source_id], dict(zip(labels, row.tolist()))
+
+
+def floyd_warshall(
+    graph: Union[Graph, CSRGraph], cache_bytes: int = 2**18
+) -> Tuple[np.ndarray, np.ndarray, Sequence[Vertex]]:
+    """Floyd-Warshall all-pairs shortest path algorithm on a dense weight
+    matrix. Edges may have negative weight when there is no negative cycle.
+
+    For each intermediate vertex k, paths i -> k -> j are compared with the
+    current paths i -> j for all (i, j) at once with NumPy. Rows are updated
+    in blocks of about `cache_bytes`, so that a block stays in the cache.
+    A Graph is converted into CSR format first, as in johnson().
+
+    Return (distance, predecessor, labels)
+           where distance[i, j] is the distance from labels[i] to labels[j]
+           (math.inf if unreachable) and predecessor[i, j] is the index of
+           the vertex before labels[j] on the shortest path from labels[i]
+           (-1 if there is no such vertex). labels is the vertex IDs of a
+           CSRGraph and the labels of its CSR format for a Graph.
+
+    Raise RuntimeError
+          when the graph has negative cycle(s).
+
+    Complexity: O(|V|^3) time and O(|V|^2) memory.
+    """
+    if isinstance(graph, CSRGraph):
+        labels = graph.get_vertices()
+    else:
+        graph = graph.to_csr()
+        labels = graph.labels
+    n = graph.num_vertices
+    sources, dests, weights = graph.get_edge_arrays()
+    distance = np.full((n, n), np.inf)
+    np.minimum.at(distance, (sources, dests), weights)
+    np.fill_diagonal(distance, np.minimum(distance.diagonal(), 0))
+    predecessor = np.where(
+        np.isfinite(distance), np.arange(n)[:, None], -1
+    ).astype(np.int64)
+    np.fill_diagonal(predecessor, -1)
+
+    block_rows = max(1, cache_bytes // (8 * max(n, 1)))
+    for k in range(n):
+        distance_from_k = distance[k].copy()
+        predecessor_from_k = predecessor[k].copy()
+        for start in range(0, n, block_rows):
+            rows = slice(start, start + block_rows)
+            candidates = distance[rows, k, None] + distance_from_k[None, :]
+            improved = candidates < distance[rows]
+            if improved.any():
+                np.copyto(distance[rows], candidates, where=improved)
+                np.copyto(
+                    predecessor[rows],
+                    np.broadcast_to(predecessor_from_k, improved.shape),
+                    where=improved,
+                )
+
+    # A vertex on a negative cycle has a negative distance to itself.
+    if np.any(distance.diagonal() < 0):
+        raise RuntimeError("Graph has negative cycle(s).")
+    return (distance, predecessor, labels)
+
+
+def reconstruct_path(
+    predecessor: np.ndarray, source: int, dest: int
+) -> List[int]:
+    """Return vertices on the shortest path from source to dest using the
+    predecessor matrix of floyd_warshall(), or [] if dest is unreachable.
+    Vertices are indices into the labels returned by floyd_warshall().
+    """
+    if source == dest:
+        return [source]
+    if predecessor[source, dest] < 0:
+        return []
+    path = [dest]
+    while path[-1] != source:
+        path.append(int(predecessor[source, path[-1]]))
+    path.reverse()
+    return path
+
+
+def __compute_potential(csr: CSRGraph) -> np.ndarray:
+    """Distances from a virtual vertex with zero weight edges to all
+    vertices, computed by Bellman-Ford algorithm.
+    """
+    n = csr.num_vertices
+    indptr = np.concatenate([csr.indptr, [csr.indptr[-1] + n]])
+    indices = np.concatenate([csr.indices, np.arange(n)])
+    weights = np.concatenate([csr.weights, np.zeros(n)])
+    augmented = CSRGraph(indptr, indices, weights)
+    distance, _ = bellman_ford(augmented, n, mode="numpy", as_arrays=True)
+    return distance[:n]
+
+
+def __build_state(arrays: SharedArrays) -> tuple:
+    graph = CSRGraph(arrays["indptr"], arrays["indices"], arrays["weights"])
+    return (graph, arrays["potential"])
+
+
+def __shortest_path_row(
+    graph: CSRGraph, potential: np.ndarray, source: int
+) -> np.ndarray:
+    distance, _ = dijkstra(graph, source, as_arrays=True)
+    return distance - potential[source] + potential
+
+
+def __shortest_path_rows(sources: range) -> List[np.ndarray]:
+    graph, potential = get_worker_state()
+    return [__shortest_path_row(graph, potential, s) for s in sources]
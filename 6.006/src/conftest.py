@@ -0,0 +1,33 @@
+import pytest
+from graph import Graph, Vertex, WeightedEdge
+from graph_generators import erdos_renyi_edges
+
+
+@pytest.fixture
+def random_graph():
+    """Return a function which builds (graph, vertices): a G(n, m) random
+    graph of erdos_renyi_edges() on Vertex objects, with distinct edges
+    without self loops and integer weights in [min_weight, max_weight].
+    """
+
+    def build(
+        num_vertex: int,
+        num_edge: int,
+        seed: int = 0,
+        min_weight: int = 1,
+        max_weight: int = 9,
+    ) -> tuple:
+        sources, dests, weights = erdos_renyi_edges(
+            num_vertex, num_edge, seed, max_weight - min_weight + 1
+        )
+        weights = weights + (min_weight - 1)
+        v = [Vertex() for i in range(num_vertex)]
+        e = [
+            WeightedEdge((v[i], v[j]), weight)
+            for i, j, weight in zip(
+                sources.tolist(), dests.tolist(), weights.tolist()
+            )
+        ]
+        return Graph(v, e), v
+
+    return build
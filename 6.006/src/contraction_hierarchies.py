@@ -0,0 +1,315 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, Union
+import math
+import heapq
+import time
+import numpy as np
+from graph import Graph, CSRGraph, Vertex, WeightedEdge
+
+
+class ContractionHierarchy:
+    """Contraction hierarchies for fast point-to-point shortest path queries.
+    All edges in the graph should have non-negative weight.
+
+    Preprocessing contracts vertices one by one in order of importance (edge
+    difference plus the number of contracted neighbors). When a vertex v is
+    contracted, a shortcut u -> x with weight w(u, v) + w(v, x) is added
+    unless a witness path from u to x avoiding v is at most as short. The
+    order of contraction is the rank of a vertex.
+
+    A query runs Dijkstra's algorithm forward from the source and backward
+    from the target, both only along edges to higher ranked vertices, and
+    shortcuts in the shortest path are unpacked into original edges.
+
+    Vertices are the vertices of the graph, or integer IDs when the graph
+    is a CSRGraph. A hierarchy loaded from a file keeps the vertices of the
+    saved one, with Vertex objects replaced by their names.
+    """
+
+    def __init__(self, graph: Graph, witness_limit: int = 64):
+        start_time = time.perf_counter()
+        csr = graph if isinstance(graph, CSRGraph) else graph.to_csr()
+        if not csr.is_non_neg_weight_graph:
+            raise ValueError("Graph has edges with negative weight.")
+        # labels[i] is the vertex of ID i, or None when vertices are IDs.
+        self.labels = None if isinstance(graph, CSRGraph) else csr.labels
+        self.__vertex_ids = None
+        self.num_vertices = csr.num_vertices
+        self.witness_limit = witness_limit
+
+        out_edges = [{} for i in range(self.num_vertices)]
+        in_edges = [{} for i in range(self.num_vertices)]
+        for u, v, weight in zip(*(a.tolist() for a in csr.get_edge_arrays())):
+            if u != v and weight < out_edges[u].get(v, math.inf):
+                out_edges[u][v] = in_edges[v][u] = weight
+        self.rank = [-1] * self.num_vertices
+        self.upward = [{} for i in range(self.num_vertices)]
+        self.reverse_upward = [{} for i in range(self.num_vertices)]
+        self.via = {}  # {(u, x): contracted vertex of shortcut u -> x}
+        self.__contract_all(out_edges, in_edges)
+
+        self.preprocessing_time = time.perf_counter() - start_time
+        self.num_queries = 0
+        self.total_query_time = 0.0
+
+    def __contract_all(self, out_edges: list, in_edges: list) -> None:
+        num_contracted_neighbors = [0] * self.num_vertices
+        queue = []
+        for v in range(self.num_vertices):
+            importance = self.__get_importance(v, out_edges, in_edges, 0)
+            queue.append((importance, v))
+        heapq.heapify(queue)
+
+        next_rank = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: contract v only if it is still the least important.
+            importance = self.__get_importance(
+                v, out_edges, in_edges, num_contracted_neighbors[v]
+            )
+            if queue and importance > queue[0][0]:
+                heapq.heappush(queue, (importance, v))
+                continue
+
+            self.rank[v] = next_rank
+            next_rank += 1
+            for u, weight in in_edges[v].items():
+                self.reverse_upward[v][u] = weight
+                del out_edges[u][v]
+                num_contracted_neighbors[u] += 1
+            for x, weight in out_edges[v].items():
+                self.upward[v][x] = weight
+                del in_edges[x][v]
+                num_contracted_neighbors[x] += 1
+            for u, x, weight in self.__find_shortcuts(v, out_edges, in_edges):
+                out_edges[u][x] = in_edges[x][u] = weight
+                self.via[u, x] = v
+            out_edges[v], in_edges[v] = {}, {}
+
+    def __get_importance(
+        self, v: int, out_edges: list, in_edges: list, num_contracted: int
+    ) -> int:
+        num_shortcuts = len(self.__find_shortcuts(v, out_edges, in_edges))
+        edge_difference = num_shortcuts - len(in_edges[v]) - len(out_edges[v])
+        return edge_difference + num_contracted
+
+    def __find_shortcuts(
+        self, v: int, out_edges: list, in_edges: list
+    ) -> List[Tuple[int, int, Union[int, float]]]:
+        """Return shortcuts (u, x, weight) needed when v is contracted."""
+        shortcuts = []
+        for u, weight_in in in_edges[v].items():
+            targets = {
+                x: weight_in + weight_out
+                for x, weight_out in out_edges[v].items()
+                if x != u
+            }
+            if not targets:
+                continue
+            witness = self.__witness_search(
+                u, v, max(targets.values()), out_edges
+            )
+            for x, weight in targets.items():
+                if witness.get(x, math.inf) > weight:
+                    shortcuts.append((u, x, weight))
+        return shortcuts
+
+    def __witness_search(
+        self, source: int, excluded: int, max_distance, out_edges: list
+    ) -> Dict[int, Union[int, float]]:
+        """Dijkstra's algorithm from the source avoiding the excluded vertex,
+        limited by the distance and the number of visited vertices. A missed
+        witness only adds an unnecessary shortcut.
+        """
+        distance = {source: 0}
+        queue = [(0, source)]
+        num_visited = 0
+        while queue and num_visited < self.witness_limit:
+            frontier_distance, frontier = heapq.heappop(queue)
+            if frontier_distance > distance[frontier]:
+                continue
+            if frontier_distance > max_distance:
+                break
+            num_visited += 1
+            for neighbor, weight in out_edges[frontier].items():
+                new_distance = frontier_distance + weight
+                if neighbor != excluded and new_distance < distance.get(
+                    neighbor, math.inf
+                ):
+                    distance[neighbor] = new_distance
+                    heapq.heappush(queue, (new_distance, neighbor))
+        return distance
+
+    def query(
+        self, source: Vertex, target: Vertex
+    ) -> Tuple[Union[int, float], List[Vertex]]:
+        """Return (distance, path) from the source to the target, or
+        (math.inf, []) when the target is unreachable.
+
+        Complexity: Depends on the hierarchy. Searches only visit vertices
+                    ranked higher than the source or the target.
+        """
+        start_time = time.perf_counter()
+        s, t = self.__get_id(source), self.__get_id(target)
+        # Index 0 is the forward search and index 1 is the backward search.
+        edges = (self.upward, self.reverse_upward)
+        distance = ({s: 0}, {t: 0})
+        parent = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        best_distance, meeting_vertex = math.inf, None
+        while True:
+            sides = [
+                i
+                for i in (0, 1)
+                if queues[i] and queues[i][0][0] < best_distance
+            ]
+            if not sides:
+                break
+            side = min(sides, key=lambda i: queues[i][0][0])
+            frontier_distance, frontier = heapq.heappop(queues[side])
+            if frontier_distance > distance[side][frontier]:
+                continue
+            other_distance = distance[1 - side].get(frontier, math.inf)
+            if frontier_distance + other_distance < best_distance:
+                best_distance = frontier_distance + other_distance
+                meeting_vertex = frontier
+            for neighbor, weight in edges[side][frontier].items():
+                new_distance = frontier_distance + weight
+                if new_distance < distance[side].get(neighbor, math.inf):
+                    distance[side][neighbor] = new_distance
+                    parent[side][neighbor] = frontier
+                    heapq.heappush(queues[side], (new_distance, neighbor))
+
+        path = []
+        if meeting_vertex is not None:
+            forward = [meeting_vertex]
+            while parent[0][forward[-1]] is not None:
+                forward.append(parent[0][forward[-1]])
+            forward.reverse()
+            backward = [meeting_vertex]
+            while parent[1][backward[-1]] is not None:
+                backward.append(parent[1][backward[-1]])
+            path = self.__unpack(forward + backward[1:])
+            path = [self.__get_label(v) for v in path]
+
+        self.num_queries += 1
+        self.total_query_time += time.perf_counter() - start_time
+        return (best_distance, path)
+
+    def __unpack(self, path: List[int]) -> List[int]:
+        """Replace shortcuts in the path with the original edges."""
+        unpacked = [path[0]]
+        stack = [(u, x) for u, x in zip(path, path[1:])][::-1]
+        while stack:
+            u, x = stack.pop()
+            if (u, x) in self.via:
+                v = self.via[u, x]
+                stack.append((v, x))
+                stack.append((u, v))
+            else:
+                unpacked.append(x)
+        return unpacked
+
+    def __get_id(self, vertex: Vertex) -> int:
+        if self.labels is None:
+            return vertex
+        if self.__vertex_ids is None:
+            self.__vertex_ids = {v: i for i, v in enumerate(self.labels)}
+        return self.__vertex_ids[vertex]
+
+    def __get_label(self, vertex_id: int) -> Vertex:
+        return vertex_id if self.labels is None else self.labels[vertex_id]
+
+    def get_augmented_graph(self) -> Graph:
+        """Return a graph of the hierarchy, i.e. the original edges which are
+        not dominated by shortcuts and the shortcut edges.
+        """
+        vertices = [self.__get_label(v) for v in range(self.num_vertices)]
+        edges = []
+        for u in range(self.num_vertices):
+            for x, weight in self.upward[u].items():
+                edges.append((u, x, weight))
+            for x, weight in self.reverse_upward[u].items():
+                edges.append((x, u, weight))
+        return Graph(
+            vertices,
+            [
+                WeightedEdge((vertices[u], vertices[x]), weight)
+                for u, x, weight in edges
+            ],
+        )
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "preprocessing_time": self.preprocessing_time,
+            "shortcuts": len(self.via),
+            "queries": self.num_queries,
+            "average_query_time": (
+                self.total_query_time / self.num_queries
+                if self.num_queries
+                else 0.0
+            ),
+        }
+
+    def save(self, path: str) -> None:
+        """Save the hierarchy into a NumPy .npz file. Edges are saved with
+        integer IDs of vertices, and the vertex of each ID is saved unless
+        vertices are IDs. Vertex objects are saved as their names.
+
+        Raise ValueError
+              when vertices (or names of Vertex objects) are not unique, or
+              they cannot be loaded back as the same numbers or strings,
+              e.g. a mix of numbers and strings.
+        """
+        arrays = {"rank": np.array(self.rank, dtype=np.int64)}
+        if self.labels is not None:
+            names = [
+                v.name if isinstance(v, Vertex) else v for v in self.labels
+            ]
+            if len(set(names)) != len(names):
+                raise ValueError("Vertices to save should have unique names.")
+            labels = np.array(names)
+            if labels.dtype == object or labels.tolist() != names:
+                raise ValueError("Vertices cannot be saved into an array.")
+            arrays["labels"] = labels
+        for name, adjacency in [
+            ("upward", self.upward),
+            ("reverse_upward", self.reverse_upward),
+        ]:
+            edges = [
+                (u, x, weight)
+                for u in range(self.num_vertices)
+                for x, weight in adjacency[u].items()
+            ]
+            table = np.array(edges, dtype=np.float64).reshape(-1, 3)
+            arrays[name] = table
+        via = [(u, x, v) for (u, x), v in self.via.items()]
+        arrays["via"] = np.array(via, dtype=np.int64).reshape(-1, 3)
+        arrays["preprocessing_time"] = np.array(self.preprocessing_time)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> ContractionHierarchy:
+        """Load a hierarchy saved by save(). Vertices are the saved
+        vertices, or integer IDs when the hierarchy was built from a
+        CSRGraph.
+        """
+        with np.load(path) as arrays:
+            hierarchy = cls.__new__(cls)
+            hierarchy.labels = None
+            if "labels" in arrays:
+                hierarchy.labels = arrays["labels"].tolist()
+            hierarchy.__vertex_ids = None
+            hierarchy.witness_limit = None
+            hierarchy.rank = arrays["rank"].tolist()
+            hierarchy.num_vertices = len(hierarchy.rank)
+            for name in ["upward", "reverse_upward"]:
+                adjacency = [{} for i in range(hierarchy.num_vertices)]
+                for u, x, weight in arrays[name].tolist():
+                    adjacency[int(u)][int(x)] = weight
+                setattr(hierarchy, name, adjacency)
+            hierarchy.via = {(u, x): v for u, x, v in arrays["via"].tolist()}
+            hierarchy.preprocessing_time = float(arrays["preprocessing_time"])
+        hierarchy.num_queries = 0
+        hierarchy.total_query_time = 0.0
+        return hierarchy
@@ -1,58 +1,177 @@
-from typing import NewType, Iterable, Any, Callable
-import math
+from typing import NewType, Iterable, Any, Callable, Sequence, Tuple
+import os
 import numpy as np
+from radix_sort import radix_sort, radix_argsort
+from parallel_sort import parallel_counting_sort
 
 PositiveInt = NewType("PositiveInt", int)
 
 
-def __get_min_max(
+def __get_keys(
     iterable: Iterable[Any], get_key: Callable[..., PositiveInt]
-):
-    min_key, max_key = math.inf, -math.inf
-    for item in iterable:
-        key = get_key(item)
-        if not isinstance(key, (int, np.integer)):
-            raise ValueError("The iterable has non-integer key values.")
-        if key > max_key:
-            max_key = key
-        if key < min_key:
-            min_key = key
-    return min_key, max_key
+) -> np.ndarray:
+    """Return the keys of all items as an integer array, calling get_key
+    once per item.
+    """
+    if get_key is None:
+        keys = np.asarray(iterable)
+    else:
+        keys = np.array([get_key(item) for item in iterable])
+    if not np.issubdtype(keys.dtype, np.integer):
+        if keys.dtype == object and all(
+            isinstance(key, (int, np.integer)) for key in keys.tolist()
+        ):
+            raise ValueError("The iterable has keys out of the int64 range.")
+        raise ValueError("The iterable has non-integer key values.")
+    return keys
+
+
+def __to_sequence(iterable: Iterable[Any]) -> Sequence[Any]:
+    """Return the iterable itself when it can be indexed, otherwise its
+    items in a list.
+    """
+    if isinstance(iterable, (np.ndarray, Sequence)):
+        return iterable
+    return list(iterable)
+
+
+def __get_count_dtype(n: int) -> np.dtype:
+    """Return the smallest unsigned integer type that can count n items."""
+    for dtype in [np.uint8, np.uint16, np.uint32]:
+        if n <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def __count_keys(offsets: np.ndarray, num_counts: int) -> np.ndarray:
+    """Return the number of occurrences of each offset in 0, 1, ...,
+    num_counts - 1 in the smallest count type.
+    """
+    dtype = __get_count_dtype(len(offsets))
+    counts = np.zeros(num_counts, dtype=dtype)
+    np.add.at(counts, offsets, dtype.type(1))
+    return counts
+
+
+def __get_order(offsets: np.ndarray, num_counts: int) -> np.ndarray:
+    """Return the indices of offsets in 0, 1, ..., num_counts - 1 in stably
+    sorted order.
+
+    NumPy sorts integers of 16 bits or less stably by counting sort, so
+    offsets are sorted in one pass over their 8- or 16-bit values, or by
+    passes over their 16-bit digits from the least significant one when
+    the range is wider.
+    """
+    num_bits = max(num_counts - 1, 1).bit_length()
+    digit_dtype = np.uint8 if num_bits <= 8 else np.uint16
+    order = np.argsort(offsets.astype(digit_dtype), kind="stable")
+    for shift in range(16, num_bits, 16):
+        digits = (offsets[order] >> shift).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+    return order
+
+
+def __get_range(keys: np.ndarray) -> Tuple[int, int]:
+    """Return the minimum key and the number of counts from the minimum
+    key to the maximum key.
+    """
+    min_key, max_key = keys.min(), keys.max()
+    if min_key < 0:
+        raise ValueError("The iterable has non-positive key values.")
+    return min_key, int(max_key) - int(min_key) + 1
+
+
+def __fits_budget(
+    num_counts: int, num_keys: int, max_bytes: int, workers: int
+) -> bool:
+    count_bytes = num_counts * __get_count_dtype(num_keys).itemsize
+    if workers != 1:  # Each process counts keys in int64.
+        count_bytes = num_counts * 8 * (workers or os.cpu_count())
+    return count_bytes <= max_bytes
 
 
 def counting_sort(
-    iterable: Iterable[Any], get_key: Callable[..., PositiveInt] = lambda x: x
+    iterable: Iterable[Any],
+    get_key: Callable[..., PositiveInt] = None,
+    max_bytes: int = 2**27,
+    workers: int = 1,
 ) -> Iterable[Any]:
     """Sort an iterable whose keys are positive integers.
 
-    iterable -- An iterable to be sorted.
+    iterable -- An iterable to be sorted. The sorted items are returned in
+                an ndarray when it is an ndarray, otherwise in a list.
     get_key -- A function that returns the key value from an item in the
-                iterable.
+                iterable. Items themselves are keys when it is None.
+    max_bytes -- The memory budget of the count array. The iterable is
+                sorted by radix sort instead when counting keys needs more.
+    workers -- The number of processes sorting keys in parallel, or None to
+                use all CPUs. Each process counts keys of its chunk in its
+                own count array. See parallel_sort.parallel_counting_sort.
+
+    Keys are extracted once into an array and counted relative to the
+    minimum key, in the smallest unsigned integer type that can count all
+    items. An integer ndarray without get_key is sorted by repeating each
+    distinct key by its count, without iterating over items in Python.
+    Otherwise items are reordered by counting_argsort.
 
     Complexity: O(n + k)
-                where n is the size of iterable and k is the maximum value of
-                keys in the iterable.
+                where n is the size of iterable and k is the range of keys
+                (maximum - minimum + 1) in the iterable.
     """
 
+    iterable = __to_sequence(iterable)
     if len(iterable) == 0:
         return iterable
 
-    min_key, max_key = __get_min_max(iterable, get_key)
-    if min_key < 0:
-        raise ValueError("The iterable has non-positive key values.")
+    if get_key is not None or not isinstance(iterable, np.ndarray):
+        order = counting_argsort(iterable, get_key, max_bytes, workers)
+        if isinstance(iterable, np.ndarray):
+            return iterable[order]
+        return [iterable[i] for i in order.tolist()]
+
+    keys = __get_keys(iterable, None)
+    min_key, num_counts = __get_range(keys)
+    if not __fits_budget(num_counts, len(keys), max_bytes, workers):
+        return radix_sort(keys, workers=workers)
+    if workers != 1:
+        return parallel_counting_sort(keys, workers)[0]
+
+    counts = __count_keys((keys - min_key).astype(np.intp), num_counts)
+    distinct = np.flatnonzero(counts)
+    sorted_keys = distinct.astype(keys.dtype) + min_key
+    return np.repeat(sorted_keys, counts[distinct])
+
 
-    position = [0] * (max_key + 1)
-    for item in iterable:
-        position[get_key(item)] += 1
+def counting_argsort(
+    iterable: Iterable[Any],
+    get_key: Callable[..., PositiveInt] = None,
+    max_bytes: int = 2**27,
+    workers: int = 1,
+) -> np.ndarray:
+    """Return the stable permutation of indices which sorts an iterable
+    whose keys are positive integers, using counting sort as counting_sort.
 
-    total = 0
-    for i in range(len(position)):
-        position[i], total = total, total + position[i]
+    Keys are evaluated once into an array and only the indices are moved
+    while sorting, so the permutation can reorder several columns, e.g.
+    `array[order]` or `frame.iloc[order]`, without sorting them again.
+    Offsets of keys from the minimum key are sorted by NumPy's stable
+    counting sort, in one pass when the range of keys fits 16 bits. The
+    permutation is computed by radix_argsort when counting keys needs more
+    than max_bytes.
+
+    Complexity: O(n * ⌈lg k / 16⌉)
+                where n is the size of iterable and k is the range of keys
+                (maximum - minimum + 1) in the iterable.
+    """
+    iterable = __to_sequence(iterable)
+    if len(iterable) == 0:
+        return np.arange(0)
 
-    output = [None] * len(iterable)
-    for item in iterable:
-        key = get_key(item)
-        output[position[key]] = item
-        position[key] += 1
+    keys = __get_keys(iterable, get_key)
+    min_key, num_counts = __get_range(keys)
+    if not __fits_budget(num_counts, len(keys), max_bytes, workers):
+        return radix_argsort(keys, workers=workers)
+    if workers != 1:
+        return parallel_counting_sort(keys, workers, return_order=True)[1]
 
-    return output
+    return __get_order((keys - min_key).astype(np.intp), num_counts)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+from typing import Tuple, Dict, Union, Set
+import math
+import heapq
+import itertools
+from graph import Graph, Vertex, WeightedEdge, dijkstra
+
+
+class DynamicShortestPath:
+    """Single-source shortest paths maintained under edge updates.
+
+    The result of dijkstra() is repaired when an edge is updated, instead of
+    being recomputed from scratch. Only vertices whose distance may change
+    are visited. All edges in the graph should have non-negative weight.
+
+    `distance` and `parent` are kept up to date in the same format as the
+    result of dijkstra(), and the graph is modified by the updates.
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        source: Vertex,
+        distance: Dict[Vertex, Union[int, float]] = None,
+        parent: Dict[Vertex, Vertex] = None,
+    ):
+        assert (
+            graph.is_non_neg_weight_graph is True
+        ), "Graph has edges with negative weight."
+        if distance is None or parent is None:
+            distance, parent = dijkstra(graph, source)
+        self.graph = graph
+        self.source = source
+        self.distance = distance
+        self.parent = parent
+        self.children = {vertex: set() for vertex in graph.get_vertices()}
+        for vertex, parent_vertex in parent.items():
+            if parent_vertex is not None:
+                self.children.setdefault(parent_vertex, set()).add(vertex)
+
+    def get_result(
+        self,
+    ) -> Tuple[Dict[Vertex, Union[int, float], Dict[Vertex, Vertex]]]:
+        return (self.distance, self.parent)
+
+    def update_edge(
+        self, source: Vertex, dest: Vertex, weight: Union[int, float]
+    ) -> Set[Vertex]:
+        """Set the weight of the edge from source to dest, adding the edge if
+        it does not exist, and repair the shortest paths.
+
+        Return a set of vertices whose distance changed.
+
+        Complexity: O(k lg k)
+                    where k is the number of vertices whose distance or
+                    parent may change and their edges.
+        """
+        if weight < 0:
+            raise ValueError("Edge weight should be non-negative.")
+        old_edge = self.graph.get_edge(source, dest)
+        if old_edge is not None:
+            self.graph.remove_edge(source, dest)
+        self.graph.add_edge(WeightedEdge((source, dest), weight))
+
+        if old_edge is not None and weight > old_edge.get_weight():
+            return self.__repair_increase(source, dest)
+        return self.__repair_decrease(source, dest, weight)
+
+    def remove_edge(self, source: Vertex, dest: Vertex) -> Set[Vertex]:
+        """Remove the edge from source to dest and repair the shortest paths.
+
+        Return a set of vertices whose distance changed.
+        """
+        self.graph.remove_edge(source, dest)
+        return self.__repair_increase(source, dest)
+
+    def __set_parent(self, vertex: Vertex, parent_vertex: Vertex) -> None:
+        old_parent = self.parent.get(vertex)
+        if old_parent is not None:
+            self.children[old_parent].discard(vertex)
+        self.parent[vertex] = parent_vertex
+        self.children.setdefault(parent_vertex, set()).add(vertex)
+
+    def __propagate(
+        self, queue: list, counter: itertools.count
+    ) -> Set[Vertex]:
+        """Dijkstra's algorithm from the vertices in the queue."""
+        changed = set()
+        while queue:
+            frontier_distance, _, frontier = heapq.heappop(queue)
+            if frontier_distance > self.distance[frontier]:
+                continue  # Outdated entry
+            changed.add(frontier)
+            for neighbor, weight in self.graph.get_weighted_neighbors(
+                frontier
+            ):
+                new_distance = frontier_distance + weight
+                if self.distance.get(neighbor, math.inf) > new_distance:
+                    self.distance[neighbor] = new_distance
+                    self.__set_parent(neighbor, frontier)
+                    heapq.heappush(
+                        queue, (new_distance, next(counter), neighbor)
+                    )
+        return changed
+
+    def __repair_decrease(
+        self, source: Vertex, dest: Vertex, weight: Union[int, float]
+    ) -> Set[Vertex]:
+        new_distance = self.distance[source] + weight
+        if new_distance >= self.distance.get(dest, math.inf):
+            return set()
+        self.distance[dest] = new_distance
+        self.__set_parent(dest, source)
+        counter = itertools.count()
+        return self.__propagate([(new_distance, next(counter), dest)], counter)
+
+    def __repair_increase(self, source: Vertex, dest: Vertex) -> Set[Vertex]:
+        if self.parent.get(dest) is not source:
+            return set()  # The edge is not in the shortest path tree.
+
+        # Vertices in the subtree of dest lose their shortest paths.
+        affected = [dest]
+        for vertex in affected:
+            affected.extend(self.children.get(vertex, ()))
+        affected_set = set(affected)
+        old_distance = {vertex: self.distance[vertex] for vertex in affected}
+        for vertex in affected:
+            self.children[self.parent.pop(vertex)].discard(vertex)
+            self.distance[vertex] = math.inf
+
+        # Shortest paths from the source to vertices outside the subtree are
+        # unchanged. Reconnect the subtree from them and propagate inside.
+        counter = itertools.count()
+        queue = []
+        for vertex in affected:
+            for predecessor, weight in self.graph.get_weighted_predecessors(
+                vertex
+            ):
+                if predecessor in affected_set:
+                    continue
+                new_distance = self.distance[predecessor] + weight
+                if self.distance[vertex] > new_distance:
+                    self.distance[vertex] = new_distance
+                    self.__set_parent(vertex, predecessor)
+            if self.distance[vertex] < math.inf:
+                queue.append((self.distance[vertex], next(counter), vertex))
+        heapq.heapify(queue)
+        self.__propagate(queue, counter)
+        return set(
+            vertex
+            for vertex in affected
+            if self.distance[vertex] != old_distance[vertex]
+        )
@@ -0,0 +1,115 @@
+from typing import Dict, List, Union
+import heapq
+import os
+import tempfile
+import time
+import numpy as np
+from radix_sort import radix_sort
+
+
+def external_radix_sort(
+    input_path: str,
+    output_path: str,
+    dtype: np.dtype = np.int64,
+    memory_bytes: int = 2**28,
+    block_bytes: int = 2**22,
+    workers: int = 1,
+    temp_dir: str = None,
+) -> Dict[str, Union[int, float]]:
+    """Sort a binary file of integers larger than memory into another file.
+
+    input_path -- A file of integers in the native binary format of dtype.
+    output_path -- A file to write the sorted integers in the same format.
+    memory_bytes -- The memory budget of a chunk sorted in memory.
+    block_bytes -- The size of blocks read from each run while merging.
+    workers -- The number of processes sorting each chunk by radix_sort.
+    temp_dir -- A directory for temporary files of sorted runs.
+
+    The input file is memory-mapped and sorted in chunks which fit in the
+    memory budget by radix_sort. Each sorted run is spilled to a temporary
+    file, and the runs are merged in sequential blocks. A heap keeps the
+    runs ordered by the last key of their current blocks, whose minimum is
+    a bound such that every buffered key up to the bound can be written:
+    those keys are cut from all blocks, sorted together and appended to
+    the output, and the run(s) with exhausted blocks read their next block.
+    A file which fits in one chunk is written without merging.
+
+    Return the statistics with the number of input bytes, the number of
+    sorted runs, the elapsed time in seconds and the throughput in input
+    bytes per second.
+
+    Complexity: O(n * b / w + n lg k) with O(n / B) sequential block I/Os
+                where n is the number of integers, b is the number of bits
+                that vary among keys, w is the digit width of radix sort,
+                k is the number of runs and B is the block size.
+    """
+    start_time = time.perf_counter()
+    dtype = np.dtype(dtype)
+    if os.path.getsize(input_path) == 0:
+        data = np.zeros(0, dtype=dtype)  # An empty file cannot be mapped.
+    else:
+        data = np.memmap(input_path, dtype=dtype, mode="r")
+    chunk_size = max(1, memory_bytes // (4 * dtype.itemsize))
+    num_runs = -(-len(data) // chunk_size)
+
+    if num_runs <= 1:
+        radix_sort(np.array(data), workers=workers).tofile(output_path)
+    else:
+        with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+            run_paths = []
+            for start in range(0, len(data), chunk_size):
+                end = start + chunk_size
+                chunk = np.array(data[start:end])
+                run_paths.append(os.path.join(run_dir, f"{len(run_paths)}"))
+                radix_sort(chunk, workers=workers).tofile(run_paths[-1])
+            del chunk
+            block_size = max(
+                1,
+                min(block_bytes, memory_bytes // (num_runs + 1))
+                // dtype.itemsize,
+            )
+            with open(output_path, "wb") as output:
+                __merge_runs(run_paths, dtype, block_size, output)
+    num_bytes = len(data) * dtype.itemsize
+    del data
+
+    elapsed_time = time.perf_counter() - start_time
+    return {
+        "bytes": num_bytes,
+        "runs": num_runs,
+        "seconds": elapsed_time,
+        "bytes_per_second": num_bytes / elapsed_time,
+    }
+
+
+def __merge_runs(
+    run_paths: List[str], dtype: np.dtype, block_size: int, output
+) -> None:
+    runs = [np.memmap(path, dtype=dtype, mode="r") for path in run_paths]
+    positions = [0] * len(runs)
+    blocks = [None] * len(runs)  # The current block of each run
+    heap = []  # (last key of the block, run)
+
+    def read_block(run: int) -> None:
+        start, end = positions[run], positions[run] + block_size
+        if start < len(runs[run]):
+            blocks[run] = np.array(runs[run][start:end])
+            positions[run] = start + len(blocks[run])
+            heapq.heappush(heap, (blocks[run][-1], run))
+
+    for run in range(len(runs)):
+        read_block(run)
+    while heap:
+        bound = heap[0][0]
+        pieces = []
+        for _, run in heap:
+            cut = np.searchsorted(blocks[run], bound, side="right")
+            pieces.append(blocks[run][:cut])
+            blocks[run] = blocks[run][cut:]
+        radix_sort(np.concatenate(pieces)).tofile(output)
+        # Blocks whose last key is the bound are exhausted.
+        exhausted = []
+        while heap and heap[0][0] == bound:
+            exhausted.append(heapq.heappop(heap)[1])
+        for run in exhausted:
+            read_block(run)
@@ -1,16 +1,51 @@
 from __future__ import annotations
-from typing import Set, Tuple, List, Dict, Union
+from typing import (
+    Set,
+    Tuple,
+    List,
+    Dict,
+    Union,
+    Iterable,
+    Iterator,
+    Callable,
+)
+import os
 import sys
 import math
+import tempfile
+import heapq
+import itertools
+import collections
+import numpy as np
+from heap import MinPriorityQueue
 
 
-def breadth_first_search(graph: Graph, source: Vertex) -> Dict[Vertex, Vertex]:
+def breadth_first_search(
+    graph: Graph, source: Vertex, as_arrays: bool = False
+) -> Dict[Vertex, Vertex]:
     """Breadth-first search. Ignore weights.
     Return parent dictionary, i.e. {vertex: parent vertex}.
 
+    A CSRGraph is searched level by level, expanding each frontier at once
+    with vectorized operations on the adjacency arrays.
+
+    as_arrays -- Only for a CSRGraph. Return (level, parent) arrays indexed
+                 by vertex instead, where level[v] = parent[v] = -1 for
+                 vertices unreachable from source and parent[source] = -1.
+
     Complexity: O(|V| + |E|)
                 where V is vertices and E is edges of the graph.
     """
+    if isinstance(graph, CSRGraph):
+        level, parent = __breadth_first_search_csr(graph, source)
+        if as_arrays:
+            return (level, parent)
+        reachable = np.flatnonzero(level > 0)
+        parent_dict = {source: None}
+        parent_dict.update(zip(reachable.tolist(), parent[reachable].tolist()))
+        return parent_dict
+    __check_dense(graph, as_arrays)
+
     parent = {source: None}
     frontiers = [source]
     for frontier in frontiers:
@@ -22,47 +57,212 @@ def breadth_first_search(graph: Graph, source: Vertex) -> Dict[Vertex, Vertex]:
     return parent
 
 
+def __breadth_first_search_csr(graph: CSRGraph, source: int):
+    level = np.full(graph.num_vertices, -1, dtype=np.int64)
+    parent = np.full(graph.num_vertices, -1, dtype=np.int64)
+    level[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    depth = 0
+    while len(frontier) != 0:
+        neighbors, sources = graph.expand(frontier)
+        is_new = level[neighbors] < 0
+        neighbors, sources = neighbors[is_new], sources[is_new]
+        # Keep the first discovery of each vertex, in the order of discovery,
+        # as in the sequential search.
+        _, first = np.unique(neighbors, return_index=True)
+        first.sort()
+        frontier = neighbors[first]
+        depth += 1
+        level[frontier] = depth
+        parent[frontier] = sources[first]
+    return (level, parent)
+
+
+def __check_dense(graph: Graph, as_arrays: bool) -> None:
+    if as_arrays and not isinstance(graph, CSRGraph):
+        raise TypeError(
+            "Array results need dense vertex IDs, use Graph.to_csr()."
+        )
+
+
+def __result_to_arrays(
+    graph: CSRGraph,
+    distance: Dict[int, Union[int, float]],
+    parent: Dict[int, int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    distance_array = np.full(graph.num_vertices, math.inf)
+    distance_array[list(distance)] = list(distance.values())
+    parent_array = np.full(graph.num_vertices, -1, dtype=np.int64)
+    for vertex, parent_vertex in parent.items():
+        if parent_vertex is not None:
+            parent_array[vertex] = parent_vertex
+    return (distance_array, parent_array)
+
+
 def depth_first_search(graph: Graph, source: Vertex) -> List[Vertex]:
     """Depth-first search. Ignore weights.
     Return visited vertices ordered by dead-end reached time.
 
+    The search keeps an explicit stack of (vertex, neighbor iterator) instead
+    of recursion, so it is not limited by the depth of recursion.
+
     Complexity: O(|V| + |E|)
                 where V is vertices and E is edges of the graph.
     """
-
-    def dfs_subroutine(vertex: Vertex):
-        neighbors = graph.get_neighbors(vertex)
+    parent = {source: None}
+    finished = []
+    stack = [(source, iter(graph.get_neighbors(source)))]
+    while stack:
+        vertex, neighbors = stack[-1]
         for neighbor in neighbors:
             if neighbor not in parent:
                 parent[neighbor] = vertex
-                dfs_subroutine(neighbor)
-        finished.append(vertex)
+                stack.append((neighbor, iter(graph.get_neighbors(neighbor))))
+                break
+        else:  # Dead-end reached
+            stack.pop()
+            finished.append(vertex)
+    return finished
 
-    parent = {source: None}
+
+def topological_sort(graph: Graph) -> List[Vertex]:
+    """Topological sort of a directed acyclic graph by depth-first search.
+    Return vertices ordered so that every edge goes from an earlier vertex to
+    a later vertex, i.e. reversed order of dead-end reached time.
+
+    Raise ValueError
+          when the graph has a cycle.
+
+    Complexity: O(|V| + |E|)
+    """
+    on_stack = {}  # {vertex: True while on the stack, False when finished}
     finished = []
-    dfs_subroutine(source)
+    for root in graph.get_vertices():
+        if root in on_stack:
+            continue
+        on_stack[root] = True
+        stack = [(root, iter(graph.get_neighbors(root)))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in on_stack:
+                    on_stack[neighbor] = True
+                    stack.append(
+                        (neighbor, iter(graph.get_neighbors(neighbor)))
+                    )
+                    break
+                elif on_stack[neighbor]:  # Back edge
+                    raise ValueError("Graph has cycle(s).")
+            else:
+                stack.pop()
+                on_stack[vertex] = False
+                finished.append(vertex)
+    finished.reverse()
     return finished
 
 
+def strongly_connected_components(graph: Graph) -> List[List[Vertex]]:
+    """Tarjan's strongly connected components algorithm with an explicit
+    stack. Return a list of components in reverse topological order of the
+    condensed graph, i.e. no edge goes from a component to a later one.
+
+    Complexity: O(|V| + |E|)
+    """
+    index = {}  # {vertex: order of discovery}
+    low = {}  # {vertex: smallest index reachable through the DFS subtree}
+    on_component_stack = set()
+    component_stack = []
+    components = []
+    for root in graph.get_vertices():
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        component_stack.append(root)
+        on_component_stack.add(root)
+        stack = [(root, iter(graph.get_neighbors(root)))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = low[neighbor] = len(index)
+                    component_stack.append(neighbor)
+                    on_component_stack.add(neighbor)
+                    stack.append(
+                        (neighbor, iter(graph.get_neighbors(neighbor)))
+                    )
+                    break
+                elif neighbor in on_component_stack:
+                    low[vertex] = min(low[vertex], index[neighbor])
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    low[parent] = min(low[parent], low[vertex])
+                if low[vertex] == index[vertex]:  # Root of a component
+                    component = []
+                    while True:
+                        member = component_stack.pop()
+                        on_component_stack.remove(member)
+                        component.append(member)
+                        if member is vertex:
+                            break
+                    components.append(component)
+    return components
+
+
 def dijkstra(
-    graph, source: Vertex
+    graph,
+    source: Vertex,
+    priority_queue: str = "lazy_heap",
+    as_arrays: bool = False,
 ) -> Tuple[Dict[Vertex, Union[int, float], Dict[Vertex, Vertex]]]:
     """Dijkstra's shortest path algorithm. All edges in the graph should have
-    non-negative weight. Complexity can be improved by using a binary min-heap
-    or Fibonacci heap which can perform 'extract-min' and 'decrease-key'
-    efficiently.
+    non-negative weight.
+
+    priority_queue -- How to find the unvisited vertex with minimum distance.
+        "array": Scan all unvisited vertices. Complexity: O(|V|^2 + |E|)
+        "binary_heap": Binary min-heap with decrease-key.
+                       Complexity: O((|V| + |E|) lg |V|)
+        "lazy_heap": Binary min-heap without decrease-key. Outdated entries
+                     are skipped when they are popped. The default, faster
+                     than "binary_heap" because it uses heapq.
+                     Complexity: O((|V| + |E|) lg |E|)
+        "bucket": Dial's algorithm. Vertices are kept in buckets indexed by
+                  distance, like keys in counting sort. Only for graphs whose
+                  weights are integers. Complexity: O(|E| + |V|⋅C)
+                  where C is the maximum weight.
+    as_arrays -- Only for a CSRGraph. Return distance and parent as arrays
+                 indexed by vertex, where parent[v] = -1 for the source and
+                 unreachable vertices.
 
     Return (distance, parent)
            where `distance` and `parent` are dictionaries,
            i.e. distance = {v: distance from the source} for v ∈ V,
                 parent = {v: parent vertex} for reachable v ∈ V from source.
-
-    Complexity: O(|V|^2 + |E|)
     """
     assert (
         graph.is_non_neg_weight_graph is True
     ), "Graph has edges with negative weight."
+    __check_dense(graph, as_arrays)
+
+    if as_arrays and priority_queue == "lazy_heap":
+        return __dijkstra_csr_arrays(graph, source)
+    elif as_arrays:
+        distance, parent = dijkstra(graph, source, priority_queue)
+        return __result_to_arrays(graph, distance, parent)
+
+    if priority_queue == "array":
+        return __dijkstra_array(graph, source)
+    elif priority_queue == "binary_heap":
+        return __dijkstra_binary_heap(graph, source)
+    elif priority_queue == "lazy_heap":
+        return __dijkstra_lazy_heap(graph, source)
+    elif priority_queue == "bucket":
+        return __dijkstra_bucket(graph, source)
+    raise ValueError(f"Unknown priority queue: {priority_queue}")
 
+
+def __dijkstra_array(graph: Graph, source: Vertex):
     parent = {source: None}
     distance = dict.fromkeys(graph.get_vertices(), math.inf)
     distance[source] = 0
@@ -72,10 +272,9 @@ def dijkstra(
         frontier = min(vertices_to_visit, key=vertices_to_visit.get)
         vertices_to_visit.pop(frontier)
 
-        neighbors = graph.get_neighbors(frontier)
-        for neighbor in neighbors:
-            edge = graph.get_edge(frontier, neighbor)
-            new_distance = distance[frontier] + edge.get_weight()
+        neighbors = graph.get_weighted_neighbors(frontier)
+        for neighbor, weight in neighbors:
+            new_distance = distance[frontier] + weight
             if distance[neighbor] > new_distance:
                 distance[neighbor] = new_distance
                 vertices_to_visit[neighbor] = new_distance
@@ -84,12 +283,129 @@ def dijkstra(
     return (distance, parent)
 
 
+def __dijkstra_binary_heap(graph: Graph, source: Vertex):
+    parent = {source: None}
+    distance = dict.fromkeys(graph.get_vertices(), math.inf)
+    distance[source] = 0
+    queue = MinPriorityQueue().insert(source, 0)
+
+    while len(queue) != 0:
+        frontier, frontier_distance = queue.extract_min()
+        for neighbor, weight in graph.get_weighted_neighbors(frontier):
+            new_distance = frontier_distance + weight
+            if distance[neighbor] > new_distance:
+                if neighbor in queue:
+                    queue.decrease_key(neighbor, new_distance)
+                else:
+                    queue.insert(neighbor, new_distance)
+                distance[neighbor] = new_distance
+                parent[neighbor] = frontier
+
+    return (distance, parent)
+
+
+def __dijkstra_csr_arrays(graph: CSRGraph, source: int):
+    """Lazy heap Dijkstra's algorithm on a CSR graph, keeping distances and
+    parents in lists indexed by vertex instead of dictionaries.
+    """
+    distance = [math.inf] * graph.num_vertices
+    parent = [-1] * graph.num_vertices
+    distance[source] = 0
+    indptr = graph.indptr
+    queue = [(0, source)]  # Vertices are integers and comparable.
+
+    while len(queue) != 0:
+        frontier_distance, frontier = heapq.heappop(queue)
+        if frontier_distance > distance[frontier]:
+            continue
+        start, end = indptr[frontier], indptr[frontier + 1]
+        for neighbor, weight in zip(
+            graph.indices[start:end].tolist(),
+            graph.weights[start:end].tolist(),
+        ):
+            new_distance = frontier_distance + weight
+            if distance[neighbor] > new_distance:
+                distance[neighbor] = new_distance
+                parent[neighbor] = frontier
+                heapq.heappush(queue, (new_distance, neighbor))
+
+    return (np.array(distance), np.array(parent, dtype=np.int64))
+
+
+def __dijkstra_lazy_heap(graph: Graph, source: Vertex):
+    parent = {source: None}
+    distance = dict.fromkeys(graph.get_vertices(), math.inf)
+    distance[source] = 0
+    counter = itertools.count()  # Tie breaker, vertices are not comparable.
+    queue = [(0, next(counter), source)]
+
+    while len(queue) != 0:
+        frontier_distance, _, frontier = heapq.heappop(queue)
+        if frontier_distance > distance[frontier]:
+            continue  # Outdated entry of an already visited vertex.
+        for neighbor, weight in graph.get_weighted_neighbors(frontier):
+            new_distance = frontier_distance + weight
+            if distance[neighbor] > new_distance:
+                distance[neighbor] = new_distance
+                parent[neighbor] = frontier
+                heapq.heappush(queue, (new_distance, next(counter), neighbor))
+
+    return (distance, parent)
+
+
+def __dijkstra_bucket(graph: Graph, source: Vertex):
+    max_weight = 0
+    for vertex in graph.get_vertices():
+        for _, weight in graph.get_weighted_neighbors(vertex):
+            if weight % 1 != 0:
+                raise ValueError("The graph has non-integer weights.")
+            max_weight = max(max_weight, weight)
+
+    parent = {source: None}
+    distance = dict.fromkeys(graph.get_vertices(), math.inf)
+    distance[source] = 0
+    # Distances of vertices in the buckets are in [d, d + C], so C + 1
+    # buckets are reused circularly.
+    num_buckets = int(max_weight) + 1
+    buckets = [[] for i in range(num_buckets)]
+    buckets[0].append(source)
+    num_entries = 1
+    current_distance = 0
+    while num_entries != 0:
+        bucket = buckets[current_distance % num_buckets]
+        while bucket:
+            frontier = bucket.pop()
+            num_entries -= 1
+            if distance[frontier] != current_distance:
+                continue  # Outdated entry
+            for neighbor, weight in graph.get_weighted_neighbors(frontier):
+                new_distance = current_distance + weight
+                if distance[neighbor] > new_distance:
+                    distance[neighbor] = new_distance
+                    parent[neighbor] = frontier
+                    buckets[int(new_distance) % num_buckets].append(neighbor)
+                    num_entries += 1
+        current_distance += 1
+
+    return (distance, parent)
+
+
 def bellman_ford(
-    graph: Graph, source: Vertex
+    graph: Graph, source: Vertex, mode: str = "rounds", as_arrays: bool = False
 ) -> Tuple[Dict[Vertex, Union[int, float], Dict[Vertex, Vertex]]]:
     """Bellman-Ford algorithm. Shortest path in a graph with negative weight
     edges can be calculated when there is no negative cycle.
 
+    mode -- How to relax the edges.
+        "rounds": Relax all edges in rounds and stop as soon as a round
+                  changes nothing.
+        "spfa": Shortest Path Faster Algorithm. Only edges from vertices
+                whose distance changed are relaxed, using a FIFO queue.
+        "numpy": Relax all edges of a round at once with NumPy arrays.
+                 Distances are returned as floats.
+    as_arrays -- Only for a CSRGraph. Return distance and parent as arrays
+                 indexed by vertex, as dijkstra() does.
+
     Return (distance, parent)
            where `distance` and `parent` are dictionaries,
            i.e. distance = {v: distance from the source} for v ∈ V,
@@ -100,73 +416,821 @@ def bellman_ford(
 
     Complexity: O(|V|⋅|E|)
     """
-    edges = graph.get_edges()
+    __check_dense(graph, as_arrays)
+    if as_arrays and mode == "numpy":
+        return __bellman_ford_numpy_arrays(graph, source)
+    elif as_arrays:
+        distance, parent = bellman_ford(graph, source, mode)
+        return __result_to_arrays(graph, distance, parent)
+
+    if mode == "rounds":
+        return __bellman_ford_rounds(graph, source)
+    elif mode == "spfa":
+        return __bellman_ford_spfa(graph, source)
+    elif mode == "numpy":
+        return __bellman_ford_numpy(graph, source)
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def __bellman_ford_rounds(graph: Graph, source: Vertex):
+    edges = [
+        (u, v, weight)
+        for u in graph.get_vertices()
+        for v, weight in graph.get_weighted_neighbors(u)
+    ]
     parent = {source: None}
     distance = dict.fromkeys(graph.get_vertices(), math.inf)
     distance[source] = 0
-    for i in range(len(graph.get_vertices()) - 1):
-        for edge in edges:
-            u, v = edge.get_source(), edge.get_dest()
-            new_dist_to_v = distance[u] + edge.get_weight()
+    for i in range(len(graph.get_vertices())):
+        changed = False
+        for u, v, weight in edges:
+            new_dist_to_v = distance[u] + weight
             if distance[v] > new_dist_to_v:
                 parent[v] = u
                 distance[v] = new_dist_to_v
+                changed = True
+        if not changed:
+            return (distance, parent)
 
-    for edge in edges:
-        u, v = edge.get_source(), edge.get_dest()
-        if distance[v] > distance[u] + edge.get_weight():
-            raise RuntimeError(
-                "Graph has negative cycle(s) reachable from source."
-            )
+    # Distances still change in the |V|-th round.
+    raise RuntimeError("Graph has negative cycle(s) reachable from source.")
+
+
+def __bellman_ford_spfa(graph: Graph, source: Vertex):
+    num_vertices = len(graph.get_vertices())
+    parent = {source: None}
+    distance = dict.fromkeys(graph.get_vertices(), math.inf)
+    distance[source] = 0
+    num_path_edges = {source: 0}  # Number of edges in the current path
+    queue = collections.deque([source])
+    in_queue = {source}
+    while queue:
+        u = queue.popleft()
+        in_queue.remove(u)
+        for v, weight in graph.get_weighted_neighbors(u):
+            new_dist_to_v = distance[u] + weight
+            if distance[v] > new_dist_to_v:
+                parent[v] = u
+                distance[v] = new_dist_to_v
+                num_path_edges[v] = num_path_edges[u] + 1
+                # A shortest path has at most |V|-1 edges.
+                if num_path_edges[v] >= num_vertices:
+                    raise RuntimeError(
+                        "Graph has negative cycle(s) reachable from source."
+                    )
+                if v not in in_queue:
+                    queue.append(v)
+                    in_queue.add(v)
+    return (distance, parent)
+
+
+def __bellman_ford_numpy(graph: Graph, source: Vertex):
+    if isinstance(graph, CSRGraph):
+        csr, labels, source_id = graph, graph.get_vertices(), source
+    else:
+        csr = graph.to_csr()
+        labels = csr.labels
+        source_id = csr.get_vertex_id(source)
+    distance, parent = __bellman_ford_numpy_arrays(csr, source_id)
 
+    parent_dict = {source: None}
+    for v in np.flatnonzero(parent >= 0).tolist():
+        parent_dict[labels[v]] = labels[parent[v]]
+    return (dict(zip(labels, distance.tolist())), parent_dict)
+
+
+def __bellman_ford_numpy_arrays(csr: CSRGraph, source_id: int):
+    sources, dests, weights = csr.get_edge_arrays()
+
+    distance = np.full(csr.num_vertices, math.inf)
+    distance[source_id] = 0
+    parent = np.full(csr.num_vertices, -1, dtype=np.int64)
+    for i in range(csr.num_vertices):
+        candidates = distance[sources] + weights
+        new_distance = distance.copy()
+        np.minimum.at(new_distance, dests, candidates)
+        improved = new_distance < distance
+        if not improved.any():
+            break
+        # Parent is the source of any edge achieving the new distance.
+        is_parent_edge = improved[dests] & (candidates == new_distance[dests])
+        parent[dests[is_parent_edge]] = sources[is_parent_edge]
+        distance = new_distance
+    else:
+        raise RuntimeError(
+            "Graph has negative cycle(s) reachable from source."
+        )
     return (distance, parent)
 
 
+def shortest_path(
+    graph: Graph, source: Vertex, target: Vertex
+) -> Tuple[Union[int, float], Iterator[Vertex]]:
+    """Dijkstra's algorithm from the source which stops as soon as the target
+    is visited. Only vertices closer than the target are visited.
+
+    Return (distance, path)
+           where `distance` is the distance from the source to the target
+           (math.inf if unreachable) and `path` is an iterator of vertices
+           on the shortest path from source to target. The path is
+           reconstructed when it is iterated.
+
+    Complexity: O((|V| + |E|) lg |E|) in the worst case.
+    """
+    assert (
+        graph.is_non_neg_weight_graph is True
+    ), "Graph has edges with negative weight."
+
+    parent = {source: None}
+    distance = {source: 0}
+    visited = set()
+    counter = itertools.count()
+    queue = [(0, next(counter), source)]
+    while queue:
+        frontier_distance, _, frontier = heapq.heappop(queue)
+        if frontier in visited:
+            continue
+        if frontier == target:
+            return (frontier_distance, __reconstruct_path(parent, target))
+        visited.add(frontier)
+        for neighbor, weight in graph.get_weighted_neighbors(frontier):
+            new_distance = frontier_distance + weight
+            if distance.get(neighbor, math.inf) > new_distance:
+                distance[neighbor] = new_distance
+                parent[neighbor] = frontier
+                heapq.heappush(queue, (new_distance, next(counter), neighbor))
+    return (math.inf, iter(()))
+
+
+def bidirectional_dijkstra(
+    graph: Graph, source: Vertex, target: Vertex
+) -> Tuple[Union[int, float], Iterator[Vertex]]:
+    """Run Dijkstra's algorithm forward from the source and backward from the
+    target, alternately, until the two searches meet. Search in the backward
+    direction uses the reverse edges of the graph.
+
+    Return (distance, path) as `shortest_path` does.
+
+    Complexity: O((|V| + |E|) lg |E|) in the worst case.
+    """
+    assert (
+        graph.is_non_neg_weight_graph is True
+    ), "Graph has edges with negative weight."
+
+    if source == target:
+        return (0, iter((source,)))
+
+    # Index 0 is the forward search and index 1 is the backward search.
+    get_neighbors = (
+        graph.get_weighted_neighbors,
+        graph.get_weighted_predecessors,
+    )
+    parent = ({source: None}, {target: None})
+    distance = ({source: 0}, {target: 0})
+    visited = (set(), set())
+    counter = itertools.count()
+    queues = ([(0, next(counter), source)], [(0, next(counter), target)])
+    best_distance, meeting_vertex = math.inf, None
+
+    while queues[0] and queues[1]:
+        # The best path cannot be improved any more.
+        if queues[0][0][0] + queues[1][0][0] >= best_distance:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        frontier_distance, _, frontier = heapq.heappop(queues[side])
+        if frontier in visited[side]:
+            continue
+        visited[side].add(frontier)
+        for neighbor, weight in get_neighbors[side](frontier):
+            new_distance = frontier_distance + weight
+            if distance[side].get(neighbor, math.inf) > new_distance:
+                distance[side][neighbor] = new_distance
+                parent[side][neighbor] = frontier
+                heapq.heappush(
+                    queues[side], (new_distance, next(counter), neighbor)
+                )
+            other_distance = distance[1 - side].get(neighbor, math.inf)
+            if new_distance + other_distance < best_distance:
+                best_distance = new_distance + other_distance
+                meeting_vertex = neighbor
+
+    if meeting_vertex is None:
+        return (math.inf, iter(()))
+    path = itertools.chain(
+        __reconstruct_path(parent[0], meeting_vertex),
+        itertools.islice(__walk_parents(parent[1], meeting_vertex), 1, None),
+    )
+    return (best_distance, path)
+
+
+def a_star(
+    graph: Graph,
+    source: Vertex,
+    target: Vertex,
+    heuristic: Callable[[Vertex], Union[int, float]],
+) -> Tuple[Union[int, float], Iterator[Vertex]]:
+    """A* search algorithm. Vertices are visited in order of the distance
+    from the source plus `heuristic(vertex)`, an estimate of the distance from
+    the vertex to the target. The result is a shortest path when the
+    heuristic is admissible, i.e. never overestimates the distance.
+
+    Return (distance, path) as `shortest_path` does.
+
+    Complexity: O((|V| + |E|) lg |E|) for a consistent heuristic.
+    """
+    assert (
+        graph.is_non_neg_weight_graph is True
+    ), "Graph has edges with negative weight."
+
+    parent = {source: None}
+    distance = {source: 0}
+    counter = itertools.count()
+    queue = [(heuristic(source), next(counter), 0, source)]
+    while queue:
+        _, _, frontier_distance, frontier = heapq.heappop(queue)
+        if frontier_distance > distance[frontier]:
+            continue  # Outdated entry
+        if frontier == target:
+            return (frontier_distance, __reconstruct_path(parent, target))
+        for neighbor, weight in graph.get_weighted_neighbors(frontier):
+            new_distance = frontier_distance + weight
+            if distance.get(neighbor, math.inf) > new_distance:
+                distance[neighbor] = new_distance
+                parent[neighbor] = frontier
+                estimate = new_distance + heuristic(neighbor)
+                heapq.heappush(
+                    queue, (estimate, next(counter), new_distance, neighbor)
+                )
+    return (math.inf, iter(()))
+
+
+def __walk_parents(parent: Dict[Vertex, Vertex], vertex: Vertex):
+    while vertex is not None:
+        yield vertex
+        vertex = parent[vertex]
+
+
+def __reconstruct_path(parent: Dict[Vertex, Vertex], target: Vertex):
+    yield from reversed(list(__walk_parents(parent, target)))
+
+
+EDGE_RECORD_DTYPE = np.dtype([("u", "<i8"), ("v", "<i8"), ("w", "<f8")])
+
+
+def read_edge_file(
+    path: str, format: str = "csv", chunk_size: int = 2**20
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Read an edge list file in chunks of at most `chunk_size` edges.
+
+    format -- Format of the file.
+        "csv", "tsv": A line "u,v,w" (or "u\tv\tw") for each edge from
+                      vertex u to vertex v with weight w. Weight is 1 when
+                      omitted. Blank lines and lines starting with "#" are
+                      skipped.
+        "binary": Packed records of EDGE_RECORD_DTYPE, i.e. little-endian
+                  int64 u, int64 v and float64 w. The file is memory-mapped.
+
+    Yield (sources, dests, weights) arrays of each chunk.
+    """
+    if format == "binary":
+        if os.path.getsize(path) == 0:
+            return  # An empty file cannot be memory-mapped.
+        records = np.memmap(path, dtype=EDGE_RECORD_DTYPE, mode="r")
+        for start in range(0, len(records), chunk_size):
+            end = start + chunk_size
+            chunk = records[start:end]
+            yield (
+                chunk["u"].astype(np.int64),
+                chunk["v"].astype(np.int64),
+                chunk["w"].astype(np.float64),
+            )
+        return
+
+    delimiters = {"csv": ",", "tsv": "\t"}
+    if format not in delimiters:
+        raise ValueError(f"Unknown edge file format: {format}")
+    with open(path) as file:
+        while True:
+            lines = list(itertools.islice(file, chunk_size))
+            if not lines:
+                return
+            lines = [line for line in lines if line.strip() and line[0] != "#"]
+            if not lines:
+                continue
+            table = np.loadtxt(lines, delimiter=delimiters[format], ndmin=2)
+            if table.shape[1] == 2:
+                weights = np.ones(len(table))
+            else:
+                weights = table[:, 2]
+            yield (
+                table[:, 0].astype(np.int64),
+                table[:, 1].astype(np.int64),
+                weights,
+            )
+
+
 class Graph:
-    """Weighted directed graph. Edges are represented by adjacency list."""
+    """Weighted directed graph. Edges are indexed by their source and
+    destination vertices, i.e. adj_weights = {source: {dest: weight}}, and
+    reverse edges are indexed in reverse_adj_weights = {dest: {source:
+    weight}}. Edges added by add_edge() are also kept in adj_edges =
+    {source: {dest: edge}}. Edges added from arrays have no WeightedEdge
+    object until one is requested, e.g. by get_edge().
+
+    `version` is increased whenever the graph is modified.
+    """
 
     def __init__(self, vertices: Set[Vertex], edges: Tuple[WeightedEdge]):
-        self.vertices = set(vertices)
-        self.is_non_neg_weight_graph = True
-        self.adj_edge_list = {}
-        for edge in edges:  # TODO: check duplicate edges
-            source = edge.get_source()
-            if source in self.adj_edge_list:
-                self.adj_edge_list[source].append(edge)
-            else:
-                self.adj_edge_list[source] = [edge]
+        self.vertices = set()
+        self.adj_edges = {}
+        self.adj_weights = {}
+        self.reverse_adj_weights = {}
+        self.num_neg_weight_edges = 0
+        self.version = 0
+        for vertex in vertices:
+            self.add_vertex(vertex)
 
-            if edge.get_weight() < 0:
-                self.is_non_neg_weight_graph = False
+        has_implicit_vertices = False
+        for edge in edges:
+            for vertex in edge.vertex_pair:
+                if vertex not in self.adj_edges:
+                    self.add_vertex(vertex)
+                    has_implicit_vertices = True
+            self.add_edge(edge)
 
-        # Check vertices ⊇ vertices from edges
-        if not self.vertices.issuperset(self.adj_edge_list.keys()):
-            self.vertices.update(self.adj_edge_list.keys())
+        if has_implicit_vertices:
             print(
                 "Warning: Some edges are connecting vertices that are not"
                 + "in this graph. Those vertices are added into the graph.",
                 file=sys.stderr,
             )
 
+    @classmethod
+    def from_edge_file(
+        cls,
+        path: str,
+        format: str = "csv",
+        chunk_size: int = 2**20,
+        num_vertices: int = None,
+    ) -> Graph:
+        """Build a graph from an edge list file read by read_edge_file().
+        Vertices are the integers in the file, and 0, 1, ...,
+        num_vertices - 1 including those without edges when num_vertices
+        is given. Edges are added chunk by chunk by add_edge_arrays(),
+        without Vertex or WeightedEdge objects.
+
+        Raise ValueError
+              when the file has duplicate edges.
+
+        Complexity: O(|V| + |E|)
+        """
+        graph = cls(range(num_vertices or 0), ())
+        for sources, dests, weights in read_edge_file(
+            path, format, chunk_size
+        ):
+            graph.add_edge_arrays(sources, dests, weights)
+        return graph
+
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        sources: np.ndarray,
+        dests: np.ndarray,
+        weights: np.ndarray,
+        num_vertices: int = None,
+    ) -> Graph:
+        """Build a graph with edges sources[i] -> dests[i] of weights[i].
+        Vertices are the integers in the arrays, and 0, 1, ...,
+        num_vertices - 1 including those without edges when num_vertices
+        is given.
+        """
+        graph = cls(range(num_vertices or 0), ())
+        return graph.add_edge_arrays(sources, dests, weights)
+
+    def add_edge_arrays(
+        self, sources: np.ndarray, dests: np.ndarray, weights: np.ndarray
+    ) -> Graph:
+        """Add edges sources[i] -> dests[i] of weights[i], adding their
+        vertices when they are not in the graph. Only the weights are stored
+        into the adjacency, without creating WeightedEdge objects.
+
+        Raise ValueError
+              when an edge is already in the graph or in the arrays. Edges
+              before the duplicate edge are added.
+
+        Complexity: O(n) where n is the number of edges to add.
+        """
+        for vertex in np.unique(np.concatenate([sources, dests])).tolist():
+            self.add_vertex(vertex)
+        adj_weights, reverse_adj_weights = (
+            self.adj_weights,
+            self.reverse_adj_weights,
+        )
+        try:
+            for u, v, weight in zip(
+                sources.tolist(), dests.tolist(), weights.tolist()
+            ):
+                if v in adj_weights[u]:
+                    raise ValueError(f"Duplicate edge from {u} to {v}.")
+                adj_weights[u][v] = reverse_adj_weights[v][u] = weight
+                if weight < 0:
+                    self.num_neg_weight_edges += 1
+        finally:
+            self.version += 1
+        return self
+
+    @property
+    def is_non_neg_weight_graph(self) -> bool:
+        return self.num_neg_weight_edges == 0
+
+    def add_vertex(self, vertex: Vertex) -> Graph:
+        """Add a vertex without edges. Do nothing if it already exists.
+
+        Complexity: O(1)
+        """
+        if vertex not in self.adj_edges:
+            self.vertices.add(vertex)
+            self.adj_edges[vertex] = {}
+            self.adj_weights[vertex] = {}
+            self.reverse_adj_weights[vertex] = {}
+            self.version += 1
+        return self
+
+    def add_edge(self, edge: WeightedEdge) -> Graph:
+        """Add an edge between vertices in the graph.
+
+        Raise ValueError
+              when the graph already has an edge with the same source and
+              destination.
+
+        Complexity: O(1)
+        """
+        source, dest = edge.get_source(), edge.get_dest()
+        if dest in self.adj_weights[source]:
+            raise ValueError(f"Duplicate edge from {source} to {dest}.")
+        self.adj_edges[source][dest] = edge
+        self.adj_weights[source][dest] = edge.get_weight()
+        self.reverse_adj_weights[dest][source] = edge.get_weight()
+        if edge.get_weight() < 0:
+            self.num_neg_weight_edges += 1
+        self.version += 1
+        return self
+
+    def remove_edge(self, source: Vertex, dest: Vertex) -> WeightedEdge:
+        """Remove the edge from source to dest and return it.
+
+        Complexity: O(1)
+        """
+        edge = self.get_edge(source, dest)
+        if edge is None:
+            raise KeyError(dest)
+        self.adj_edges[source].pop(dest, None)
+        del self.adj_weights[source][dest]
+        del self.reverse_adj_weights[dest][source]
+        if edge.get_weight() < 0:
+            self.num_neg_weight_edges -= 1
+        self.version += 1
+        return edge
+
     def get_vertices(self) -> Set[Vertex]:
         return self.vertices
 
+    def to_csr(self) -> CSRGraph:
+        """Convert the graph into CSR format. Vertex `i` of the CSR graph is
+        `labels[i]` of this graph.
+
+        Complexity: O(|V| + |E|)
+        """
+        labels = list(self.vertices)
+        index = {vertex: i for i, vertex in enumerate(labels)}
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        indices, weights = [], []
+        for i, vertex in enumerate(labels):
+            for dest, weight in self.adj_weights[vertex].items():
+                indices.append(index[dest])
+                weights.append(weight)
+            indptr[i + 1] = len(indices)
+        return CSRGraph(indptr, indices, weights, labels)
+
     def get_edges(self) -> Tuple[WeightedEdge]:
-        list_of_edge_list = self.adj_edge_list.values()
-        return tuple(e for adj_edges in list_of_edge_list for e in adj_edges)
+        return tuple(
+            edge
+            for source in self.adj_weights
+            for edge in self.get_edges_from(source)
+        )
+
+    def get_edges_from(self, source: Vertex) -> Iterable[WeightedEdge]:
+        edges = self.adj_edges[source]
+        if len(edges) == len(self.adj_weights[source]):
+            return edges.values()
+        return [
+            self.get_edge(source, dest) for dest in self.adj_weights[source]
+        ]
+
+    def get_neighbors(self, source: Vertex) -> Iterable[Vertex]:
+        """Return a set-like view of the neighbors. Nothing is copied."""
+        return self.adj_weights[source].keys()
+
+    def get_weighted_neighbors(
+        self, source: Vertex
+    ) -> Iterable[Tuple[Vertex, Union[int, float]]]:
+        """Return a view of (neighbor, weight of the edge to the neighbor).
+        Nothing is copied.
+        """
+        return self.adj_weights[source].items()
 
-    def get_neighbors(self, source: Vertex) -> Set[Vertex]:
-        edges = self.adj_edge_list.get(source, [])
-        return set(e.get_dest() for e in edges)
+    def get_weighted_predecessors(
+        self, dest: Vertex
+    ) -> Iterable[Tuple[Vertex, Union[int, float]]]:
+        """Return a view of (predecessor, weight of the edge to dest).
+        Nothing is copied.
+        """
+        return self.reverse_adj_weights[dest].items()
 
     def get_edge(self, source: Vertex, dest: Vertex) -> WeightedEdge:
-        edges = self.adj_edge_list[source]
-        for edge in edges:
-            if edge.get_dest() == dest:
-                return edge
+        """Return the edge from source to dest, or None if there is no such
+        edge.
+
+        Complexity: O(1)
+        """
+        edge = self.adj_edges[source].get(dest)
+        if edge is None and dest in self.adj_weights[source]:
+            edge = WeightedEdge((source, dest), self.adj_weights[source][dest])
+        return edge
+
+
+class CSRGraph:
+    """Weighted directed graph in compressed sparse row (CSR) format.
+
+    Vertices are integers 0, 1, ..., |V|-1. Destinations and weights of the
+    edges from vertex u are indices[indptr[u]:indptr[u + 1]] and
+    weights[indptr[u]:indptr[u + 1]]. `labels[u]` is the original vertex of u
+    when the graph is converted from a Graph. The graph is not modifiable.
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        labels: List[Vertex] = None,
+    ):
+        self.num_vertices = len(indptr) - 1
+        index_dtype = np.int32 if self.num_vertices < 2**31 else np.int64
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=index_dtype)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        if len(self.indices) != self.indptr[-1] or len(self.weights) != len(
+            self.indices
+        ):
+            raise ValueError("Sizes of indptr, indices and weights mismatch.")
+        self.labels = labels
+        self.is_non_neg_weight_graph = bool(np.all(self.weights >= 0))
+        self.__transpose = None
+        self.__vertex_ids = None
+        self.version = 0
+
+    @classmethod
+    def from_edge_file(
+        cls,
+        path: str,
+        format: str = "csv",
+        chunk_size: int = 2**20,
+        num_vertices: int = None,
+    ) -> CSRGraph:
+        """Build a CSR graph from an edge list file read by read_edge_file().
+        Vertices are 0, 1, ..., num_vertices - 1, where num_vertices is the
+        maximum integer in the file plus one by default.
+
+        The file is read twice, first to count the degree of each vertex and
+        then to place edges at their positions in the CSR arrays, so that
+        memory is not used much more than the final arrays. A text file is
+        parsed once into a temporary binary edge file, which is
+        memory-mapped in both passes.
+
+        Raise ValueError
+              when the file has duplicate edges or vertices out of range.
+
+        Complexity: O(|V| + |E| lg d)
+                    where d is the maximum out-degree.
+        """
+        if format != "binary":
+            with tempfile.TemporaryDirectory() as directory:
+                binary_path = os.path.join(directory, "edges.bin")
+                with open(binary_path, "wb") as file:
+                    for sources, dests, weights in read_edge_file(
+                        path, format, chunk_size
+                    ):
+                        records = np.empty(len(sources), EDGE_RECORD_DTYPE)
+                        records["u"], records["v"] = sources, dests
+                        records["w"] = weights
+                        records.tofile(file)
+                return cls.from_edge_file(
+                    binary_path, "binary", chunk_size, num_vertices
+                )
+
+        def chunks():
+            return read_edge_file(path, format, chunk_size)
+
+        degrees = np.zeros(num_vertices or 0, dtype=np.int64)
+        for sources, dests, _ in chunks():
+            if len(sources) == 0:
+                continue
+            max_vertex = int(max(sources.max(), dests.max()))
+            if num_vertices is not None and max_vertex >= num_vertices:
+                raise ValueError(f"Vertex {max_vertex} is out of range.")
+            if len(degrees) <= max_vertex:
+                padding = np.zeros(max_vertex + 1 - len(degrees), np.int64)
+                degrees = np.concatenate([degrees, padding])
+            degrees += np.bincount(sources, minlength=len(degrees))
+
+        indptr = np.zeros(len(degrees) + 1, dtype=np.int64)
+        np.cumsum(degrees, out=indptr[1:])
+        index_dtype = np.int32 if len(degrees) < 2**31 else np.int64
+        indices = np.empty(indptr[-1], dtype=index_dtype)
+        weights = np.empty(indptr[-1], dtype=np.float64)
+        next_position = indptr[:-1].copy()
+        for sources, dests, chunk_weights in chunks():
+            # Edges from the same vertex keep their order in the file.
+            order = np.argsort(sources, kind="stable")
+            sources = sources[order]
+            vertices, starts, counts = np.unique(
+                sources, return_index=True, return_counts=True
+            )
+            rank = np.arange(len(sources)) - np.repeat(starts, counts)
+            positions = next_position[sources] + rank
+            indices[positions] = dests[order]
+            weights[positions] = chunk_weights[order]
+            next_position[vertices] += counts
+        cls.__check_duplicate_edges(indptr, indices, chunk_size)
+        return cls(indptr, indices, weights)
+
+    @staticmethod
+    def __check_duplicate_edges(
+        indptr: np.ndarray, indices: np.ndarray, chunk_size: int
+    ) -> None:
+        """Raise ValueError when a vertex has two edges to the same vertex.
+        Rows are checked in blocks of about `chunk_size` edges.
+        """
+        num_vertices = len(indptr) - 1
+        degrees = np.diff(indptr)
+        start = 0
+        while start < num_vertices:
+            end = int(
+                np.searchsorted(indptr, indptr[start] + chunk_size, "right")
+            )
+            end = min(max(end - 1, start + 1), num_vertices)
+            first, last = indptr[start], indptr[end]
+            rows = np.repeat(np.arange(start, end), degrees[start:end])
+            keys = rows * num_vertices + indices[first:last]
+            keys.sort()
+            duplicate = np.flatnonzero(keys[1:] == keys[:-1])
+            if len(duplicate) != 0:
+                u, v = divmod(int(keys[duplicate[0]]), num_vertices)
+                raise ValueError(f"Duplicate edge from {u} to {v}.")
+            start = end
+
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        sources: np.ndarray,
+        dests: np.ndarray,
+        weights: np.ndarray,
+        num_vertices: int = None,
+    ) -> CSRGraph:
+        """Build a CSR graph with edges sources[i] -> dests[i] of weights[i].
+        Vertices are 0, 1, ..., num_vertices - 1, where num_vertices is the
+        maximum vertex in the arrays plus one by default.
+
+        Raise ValueError
+              when there are duplicate edges or vertices out of range.
+
+        Complexity: O(|V| + |E| lg |E|)
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        dests = np.asarray(dests, dtype=np.int64)
+        max_vertex = -1
+        if len(sources):
+            max_vertex = int(max(sources.max(), dests.max()))
+        if num_vertices is None:
+            num_vertices = max_vertex + 1
+        elif max_vertex >= num_vertices:
+            raise ValueError(f"Vertex {max_vertex} is out of range.")
+        # Edges from the same vertex keep their order in the arrays.
+        order = np.argsort(sources, kind="stable")
+        indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices), out=indptr[1:])
+        indices = dests[order]
+        cls.__check_duplicate_edges(indptr, indices, 2**20)
+        return cls(indptr, indices, np.asarray(weights)[order])
+
+    def __repr__(self):
+        return (
+            f"<CSRGraph; vertices={self.num_vertices}, "
+            + f"edges={len(self.indices)}>"
+        )
+
+    def get_vertices(self) -> range:
+        return range(self.num_vertices)
+
+    def get_label(self, vertex_id: int) -> Vertex:
+        """Return the original vertex of the vertex ID."""
+        return self.labels[vertex_id]
+
+    def get_vertex_id(self, label: Vertex) -> int:
+        """Return the vertex ID of the original vertex. The mapping is built
+        once and cached.
+        """
+        if self.__vertex_ids is None:
+            self.__vertex_ids = {v: i for i, v in enumerate(self.labels)}
+        return self.__vertex_ids[label]
+
+    def get_edges(self) -> Tuple[WeightedEdge]:
+        sources, dests, weights = self.get_edge_arrays()
+        return tuple(
+            WeightedEdge((u, v), w)
+            for u, v, w in zip(
+                sources.tolist(), dests.tolist(), weights.tolist()
+            )
+        )
+
+    def get_edge_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (sources, dests, weights) arrays of all edges."""
+        sources = np.repeat(
+            np.arange(self.num_vertices, dtype=self.indices.dtype),
+            np.diff(self.indptr),
+        )
+        return sources, self.indices, self.weights
+
+    def get_edges_from(self, source: int) -> List[WeightedEdge]:
+        start, end = self.indptr[source], self.indptr[source + 1]
+        return [
+            WeightedEdge((source, v), w)
+            for v, w in zip(
+                self.indices[start:end].tolist(),
+                self.weights[start:end].tolist(),
+            )
+        ]
+
+    def get_weighted_neighbors(self, source: int) -> List[Tuple[int, float]]:
+        start, end = self.indptr[source], self.indptr[source + 1]
+        return list(
+            zip(
+                self.indices[start:end].tolist(),
+                self.weights[start:end].tolist(),
+            )
+        )
+
+    def get_weighted_predecessors(self, dest: int) -> List[Tuple[int, float]]:
+        return self.transpose().get_weighted_neighbors(dest)
+
+    def transpose(self) -> CSRGraph:
+        """Return the graph with reversed edges. It is built once and cached.
+
+        Complexity: O(|V| + |E|) for the first call.
+        """
+        if self.__transpose is None:
+            sources, dests, weights = self.get_edge_arrays()
+            order = np.argsort(dests, kind="stable")
+            indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(dests, minlength=self.num_vertices),
+                out=indptr[1:],
+            )
+            self.__transpose = CSRGraph(
+                indptr, sources[order], weights[order], self.labels
+            )
+        return self.__transpose
+
+    def get_neighbors(self, source: int) -> List[int]:
+        start, end = self.indptr[source], self.indptr[source + 1]
+        return self.indices[start:end].tolist()
+
+    def get_edge(self, source: int, dest: int) -> WeightedEdge:
+        start, end = self.indptr[source], self.indptr[source + 1]
+        for i in np.flatnonzero(self.indices[start:end] == dest)[:1]:
+            return WeightedEdge((source, dest), self.weights[start + i].item())
+
+    def expand(self, frontier: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (neighbors, sources) of all edges from the frontier vertices,
+        i.e. there is an edge sources[i] -> neighbors[i] for each i.
+
+        Complexity: O(|F| + |E_F|)
+                    where F is the frontier and E_F is edges from F.
+        """
+        starts = self.indptr[frontier]
+        degrees = self.indptr[frontier + 1] - starts
+        total = int(degrees.sum())
+        # Position of each edge in `indices`: starts of its vertex + offset
+        offsets = np.arange(total) - np.repeat(
+            np.cumsum(degrees) - degrees, degrees
+        )
+        positions = np.repeat(starts, degrees) + offsets
+        return self.indices[positions], np.repeat(frontier, degrees)
 
 
 class Vertex:
+    __slots__ = ("name", "num")
     num_vertex = 0
 
     def __init__(self, name: str = None):
@@ -184,6 +1248,8 @@ class Vertex:
 class WeightedEdge:
     """Weighted Directed Edge"""
 
+    __slots__ = ("vertex_pair", "weight")
+
     def __init__(
         self, vertex_pair: Tuple[Vertex, Vertex], weight: Union[int, float]
     ):
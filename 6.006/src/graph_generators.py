@@ -0,0 +1,152 @@
+from typing import Tuple
+import os
+import math
+import numpy as np
+from graph import Graph, CSRGraph, EDGE_RECORD_DTYPE
+
+EdgeArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def grid_edges(
+    num_vertices: int, seed: int = 0, max_weight: int = 100
+) -> EdgeArrays:
+    """Square grid with two-way edges between horizontal and vertical
+    neighbors, with random integer weights in [1, max_weight].
+    """
+    side = math.ceil(math.sqrt(num_vertices))
+    ids = np.arange(side * side).reshape(side, side)
+    pairs = [
+        (ids[:, :-1].ravel(), ids[:, 1:].ravel()),
+        (ids[:-1, :].ravel(), ids[1:, :].ravel()),
+    ]
+    sources = np.concatenate([a for a, b in pairs] + [b for a, b in pairs])
+    dests = np.concatenate([b for a, b in pairs] + [a for a, b in pairs])
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, max_weight, len(sources), endpoint=True)
+    # Drop grid points beyond num_vertices.
+    is_in_range = (sources < num_vertices) & (dests < num_vertices)
+    return sources[is_in_range], dests[is_in_range], weights[is_in_range]
+
+
+def erdos_renyi_edges(
+    num_vertices: int, num_edges: int, seed: int = 0, max_weight: int = 100
+) -> EdgeArrays:
+    """G(n, m) random graph: `num_edges` distinct directed edges chosen
+    uniformly at random, without self loops.
+    """
+    num_edges = min(num_edges, num_vertices * (num_vertices - 1))
+    rng = np.random.default_rng(seed)
+    keys = np.zeros(0, dtype=np.int64)
+    while len(keys) < num_edges:
+        size = 2 * (num_edges - len(keys)) + 16
+        sources = rng.integers(0, num_vertices, size)
+        dests = rng.integers(0, num_vertices, size)
+        new_keys = (sources * num_vertices + dests)[sources != dests]
+        # Keep the first occurrence of each edge in the order of sampling.
+        keys = np.concatenate([keys, new_keys])
+        _, first = np.unique(keys, return_index=True)
+        keys = keys[np.sort(first)]
+    keys = keys[:num_edges]
+    weights = rng.integers(1, max_weight, num_edges, endpoint=True)
+    return keys // num_vertices, keys % num_vertices, weights
+
+
+def power_law_edges(
+    num_vertices: int, num_edges: int, seed: int = 0, max_weight: int = 100
+) -> EdgeArrays:
+    """Barabási-Albert preferential attachment graph, whose degrees follow a
+    power law. Each new vertex has about num_edges / num_vertices edges to
+    existing vertices chosen with probability proportional to their degree.
+    Edges are two-way.
+    """
+    rng = np.random.default_rng(seed)
+    m = max(1, num_edges // max(num_vertices, 1) // 2)
+    endpoints = list(range(min(m, num_vertices)))  # Degree-weighted list
+    sources, dests = [], []
+    for v in range(m, num_vertices):
+        picks = rng.integers(0, len(endpoints), 2 * m)
+        targets = list(dict.fromkeys(endpoints[i] for i in picks))[:m]
+        for u in targets:
+            sources += [v, u]
+            dests += [u, v]
+            endpoints += [v, u]
+    weights = rng.integers(1, max_weight, len(sources), endpoint=True)
+    return (
+        np.array(sources, dtype=np.int64),
+        np.array(dests, np.int64),
+        weights,
+    )
+
+
+def road_like_edges(
+    num_vertices: int, seed: int = 0, keep_probability: float = 0.8
+) -> EdgeArrays:
+    """Road-network-like graph: a grid of jittered points in which each
+    two-way road between grid neighbors exists with `keep_probability`.
+    Weights are the rounded Euclidean lengths of the roads, so that they
+    satisfy the triangle inequality approximately as road lengths do.
+    """
+    sources, dests, _ = grid_edges(num_vertices, seed)
+    rng = np.random.default_rng(seed)
+    side = math.ceil(math.sqrt(num_vertices))
+    x = np.arange(side * side) % side + rng.uniform(-0.3, 0.3, side * side)
+    y = np.arange(side * side) // side + rng.uniform(-0.3, 0.3, side * side)
+    # Roads are kept or removed in both directions together.
+    half = len(sources) // 2
+    keep = rng.random(half) < keep_probability
+    keep = np.concatenate([keep, keep])
+    sources, dests = sources[keep], dests[keep]
+    lengths = np.hypot(x[sources] - x[dests], y[sources] - y[dests])
+    weights = np.maximum(np.rint(100 * lengths), 1).astype(np.int64)
+    return sources, dests, weights
+
+
+def generate_graph(
+    kind: str,
+    num_vertices: int,
+    num_edges: int = None,
+    seed: int = 0,
+    cache_dir: str = None,
+    as_csr: bool = False,
+):
+    """Generate a graph of the kind ("grid", "erdos_renyi", "power_law" or
+    "road_like"). `num_edges` is used by "erdos_renyi" and "power_law".
+
+    When `cache_dir` is given, the edges are saved into a binary edge file
+    named by the parameters, and the file is loaded instead of generating
+    the graph again.
+
+    Return Graph or CSRGraph (if `as_csr`) whose vertices are integers.
+    """
+    generators = {
+        "grid": lambda: grid_edges(num_vertices, seed),
+        "erdos_renyi": lambda: erdos_renyi_edges(
+            num_vertices, num_edges, seed
+        ),
+        "power_law": lambda: power_law_edges(num_vertices, num_edges, seed),
+        "road_like": lambda: road_like_edges(num_vertices, seed),
+    }
+    if kind not in generators:
+        raise ValueError(f"Unknown graph kind: {kind}")
+
+    if cache_dir is None:
+        edges = generators[kind]()
+        if as_csr:
+            return CSRGraph.from_edge_arrays(*edges, num_vertices)
+        return Graph.from_edge_arrays(*edges, num_vertices)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(
+        cache_dir, f"{kind}_{num_vertices}_{num_edges}_{seed}.bin"
+    )
+    if not os.path.exists(path):
+        sources, dests, weights = generators[kind]()
+        records = np.empty(len(sources), dtype=EDGE_RECORD_DTYPE)
+        records["u"], records["v"], records["w"] = sources, dests, weights
+        records.tofile(path)
+    # Vertices without edges are not in the file.
+    if as_csr:
+        return CSRGraph.from_edge_file(
+            path, "binary", num_vertices=num_vertices
+        )
+    return Graph.from_edge_file(path, "binary", num_vertices=num_vertices)
@@ -113,3 +113,96 @@ class MaxHeap:
 
         self.heap = heap_copy
         return desc_sorted_list
+
+
+class MinPriorityQueue:
+    """Binary min-heap of items with keys, supporting decrease-key.
+
+    Positions of items in the heap are tracked in a dictionary, so that the
+    key of an item can be found and decreased without searching the heap.
+    """
+
+    def __init__(self):
+        self.heap = []  # [key, item] pairs
+        self.position = {}  # {item: index in heap}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def get_key(self, item):
+        return self.heap[self.position[item]][0]
+
+    def insert(self, item, key) -> MinPriorityQueue:
+        """
+        Insert an item with the key.
+
+        Complexity: O(lg(n))
+        """
+        if item in self.position:
+            raise KeyError(f"{item} is already in the queue.")
+        self.heap.append([key, item])
+        self.position[item] = len(self.heap) - 1
+        self.sift_up(len(self.heap) - 1)
+        return self
+
+    def extract_min(self) -> tuple:
+        """
+        Remove the item with the minimum key and return (item, key).
+
+        Complexity: O(lg(n))
+        """
+        if len(self.heap) == 0:
+            raise IndexError("Extract from an empty queue.")
+        self.swap(0, len(self.heap) - 1)
+        key, item = self.heap.pop()
+        del self.position[item]
+        if self.heap:
+            self.min_heapify(0)
+        return item, key
+
+    def decrease_key(self, item, key) -> MinPriorityQueue:
+        """
+        Decrease the key of the item in the queue.
+
+        Complexity: O(lg(n))
+        """
+        i = self.position[item]
+        if key > self.heap[i][0]:
+            raise ValueError("New key is greater than the current key.")
+        self.heap[i][0] = key
+        self.sift_up(i)
+        return self
+
+    def sift_up(self, i: int) -> None:
+        while i > 0:
+            parent_index = (i + 1) // 2 - 1
+            if self.heap[i][0] < self.heap[parent_index][0]:
+                self.swap(i, parent_index)
+                i = parent_index
+            else:
+                break
+
+    def min_heapify(self, i: int) -> None:
+        """
+        Correct a single violation of the heap property in a subtree's root.
+
+        Complexity: O(lg(n))
+        """
+        n = len(self.heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and self.heap[child][0] < self.heap[smallest][0]:
+                    smallest = child
+            if smallest == i:
+                return
+            self.swap(i, smallest)
+            i = smallest
+
+    def swap(self, i: int, j: int) -> None:
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        self.position[self.heap[i][1]] = i
+        self.position[self.heap[j][1]] = j
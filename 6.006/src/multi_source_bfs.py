@@ -0,0 +1,61 @@
+from typing import Sequence
+import numpy as np
+from graph import CSRGraph
+
+
+def multi_source_breadth_first_search(
+    graph: CSRGraph, sources: Sequence[int], return_levels: bool = True
+) -> np.ndarray:
+    """Breadth-first search from many sources at once. Ignore weights.
+
+    Each vertex has a bitset of k = len(sources) bits, packed into
+    ceil(k / 64) uint64 words, where bit i is set when the vertex is in the
+    frontier of the search from sources[i]. All searches advance together:
+    the next frontier bitset of a vertex is the bitwise OR of the frontier
+    bitsets of its predecessors, minus already visited bits.
+
+    Return level matrix of shape (k, |V|)
+           where level[i, v] is the number of edges on the shortest path
+           from sources[i] to v, or -1 when v is unreachable.
+           When `return_levels` is False, return the visited bitsets of
+           shape (|V|, ceil(k / 64)) instead, i.e. v is reachable from
+           sources[i] iff (bitsets[v, i // 64] >> (i % 64)) & 1.
+
+    Complexity: O(D⋅(|V| + |E|)⋅k / 64)
+                where D is the maximum level of all searches.
+    """
+    k = len(sources)
+    num_words = (k + 63) // 64
+    visited = np.zeros((graph.num_vertices, num_words), dtype=np.uint64)
+    frontier = np.zeros_like(visited)
+    bits = np.arange(k)
+    np.bitwise_or.at(
+        frontier,
+        (np.asarray(sources, dtype=np.int64), bits // 64),
+        np.left_shift(np.uint64(1), (bits % 64).astype(np.uint64)),
+    )
+    visited |= frontier
+    if return_levels:
+        level = np.full((k, graph.num_vertices), -1, dtype=np.int32)
+        level[bits, sources] = 0
+
+    depth = 0
+    active = np.flatnonzero(frontier.any(axis=1))
+    while len(active) != 0:
+        neighbors, predecessors = graph.expand(active.astype(np.int64))
+        next_frontier = np.zeros_like(visited)
+        np.bitwise_or.at(next_frontier, neighbors, frontier[predecessors])
+        next_frontier &= ~visited
+        visited |= next_frontier
+        frontier = next_frontier
+        active = np.flatnonzero(frontier.any(axis=1))
+        depth += 1
+        if return_levels and len(active) != 0:
+            # (active vertices, bits) -> (sources, active vertices)
+            is_new = np.unpackbits(
+                frontier[active].view(np.uint8), axis=1, bitorder="little"
+            )[:, :k]
+            source_index, vertex_index = np.nonzero(is_new.T)
+            level[source_index, active[vertex_index]] = depth
+
+    return level if return_levels else visited
@@ -0,0 +1,127 @@
+from typing import Tuple
+import os
+import threading
+import numpy as np
+from graph import CSRGraph
+from shared_arrays import (
+    SharedArrays,
+    get_context,
+    init_worker,
+    get_worker_state,
+    close_worker,
+)
+
+
+def parallel_breadth_first_search(
+    graph: CSRGraph, source: int, workers: int = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Level-synchronous breadth-first search by `workers` processes.
+
+    The CSR arrays of the graph, the level and the parent of each vertex
+    and two frontier buffers are placed in shared memory. For each level,
+    each process expands its share of the frontier and claims undiscovered
+    neighbors by writing their level and parent into the shared arrays.
+    When several processes claim the same vertex, one of the parents
+    survives and the process which wrote it appends the vertex to the next
+    frontier at an offset given by a prefix sum of the numbers of claimed
+    vertices. Processes synchronize by a barrier between these steps, and
+    the main process only waits for them.
+
+    Return (level, parent)
+           where `level` and `parent` are arrays indexed by vertex, and
+           level[v] = parent[v] = -1 for vertices unreachable from source.
+           parent[source] is also -1. parent[v] is a vertex one level
+           closer to source, which may differ from the one found by
+           sequential search.
+
+    Complexity: O(|V| + |E|) work in total.
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    n = graph.num_vertices
+    level = np.full(n, -1, dtype=np.int64)
+    level[source] = 0
+    frontier_shape = ((n,), graph.indices.dtype)
+    arrays = {
+        "indptr": graph.indptr,
+        "indices": graph.indices,
+        "level": level,
+        "parent": np.full(n, -1, dtype=np.int64),
+        "frontier0": frontier_shape,
+        "frontier1": frontier_shape,
+        "counts": ((workers,), np.int64),
+    }
+    with SharedArrays.create(arrays) as shared:
+        shared["frontier0"][0] = source
+        if workers == 1:
+            init_worker(shared.specs, __build_state)
+            try:
+                __search(0, 1, threading.Barrier(1))
+            finally:
+                close_worker()
+        else:
+            context = get_context()
+            barrier = context.Barrier(workers)
+            processes = [
+                context.Process(
+                    target=__run_worker,
+                    args=(shared.specs, rank, workers, barrier),
+                )
+                for rank in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+            if any(process.exitcode != 0 for process in processes):
+                raise RuntimeError("A worker process failed.")
+        level, parent = shared["level"].copy(), shared["parent"].copy()
+    return (level, parent)
+
+
+def __run_worker(specs: dict, rank: int, workers: int, barrier) -> None:
+    init_worker(specs, __build_state)
+    try:
+        __search(rank, workers, barrier)
+    except BaseException:
+        barrier.abort()  # Release the other processes waiting at barrier.
+        raise
+    finally:
+        close_worker()
+
+
+def __search(rank: int, workers: int, barrier) -> None:
+    graph, level, parent, frontiers, counts = get_worker_state()
+    current, frontier_size, depth = 0, 1, 0
+    while frontier_size != 0:
+        bounds = np.linspace(0, frontier_size, workers + 1, dtype=np.int64)
+        start, end = bounds[rank], bounds[rank + 1]
+        chunk = frontiers[current][start:end].astype(np.int64)
+        neighbors, sources = graph.expand(chunk)
+        is_new = level[neighbors] == -1
+        neighbors, first = np.unique(neighbors[is_new], return_index=True)
+        sources = sources[is_new][first]
+        level[neighbors] = depth + 1
+        parent[neighbors] = sources
+        barrier.wait()
+
+        # Only one of the processes claiming a vertex wrote its parent.
+        neighbors = neighbors[parent[neighbors] == sources]
+        counts[rank] = len(neighbors)
+        barrier.wait()
+
+        offset = int(counts[:rank].sum())
+        frontier_size = int(counts.sum())
+        end = offset + len(neighbors)
+        frontiers[1 - current][offset:end] = neighbors
+        barrier.wait()
+        current, depth = 1 - current, depth + 1
+
+
+def __build_state(arrays: SharedArrays) -> tuple:
+    # Breadth-first search never reads weights.
+    weights = np.broadcast_to(np.float64(0), arrays["indices"].shape)
+    graph = CSRGraph(arrays["indptr"], arrays["indices"], weights)
+    frontiers = (arrays["frontier0"], arrays["frontier1"])
+    level, parent = arrays["level"], arrays["parent"]
+    return (graph, level, parent, frontiers, arrays["counts"])
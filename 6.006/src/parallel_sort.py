@@ -0,0 +1,172 @@
+from typing import Optional, Tuple
+import os
+import numpy as np
+from shared_arrays import (
+    SharedArrays,
+    get_context,
+    init_worker,
+    get_worker_state,
+    close_worker,
+)
+
+
+def parallel_radix_sort(
+    keys: np.ndarray, workers: int = None, return_order: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Stable LSD radix sort of unsigned integer keys by a pool of processes.
+
+    Keys are sorted by 8- or 16-bit digits like radix_sort, skipping digits
+    shared by all keys, and each pass over a digit is done by
+    `__parallel_pass`.
+
+    Return (sorted keys, order)
+           where `order` is the stable permutation which sorts the keys, or
+           None when return_order is False.
+
+    Complexity: O(n * b / w) work in total
+                where n is the size of keys, b is the number of bits that
+                vary among keys and w is the digit width.
+    """
+    if not np.issubdtype(keys.dtype, np.unsignedinteger):
+        raise ValueError("Keys should be unsigned integers.")
+    passes = []
+    if len(keys) > 1:
+        varying_bits = int(np.bitwise_or.reduce(keys ^ keys[0]))
+        num_bits = varying_bits.bit_length()
+        width = 16 if num_bits > 8 and len(keys) >= 2**16 else 8
+        for shift in range(0, num_bits, width):
+            if (varying_bits >> shift) & ((1 << width) - 1) != 0:
+                passes.append((0, shift, 1 << width))
+    return __sort(keys, passes, workers, return_order)
+
+
+def parallel_counting_sort(
+    keys: np.ndarray, workers: int = None, return_order: bool = False
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Stable counting sort of integer keys by a pool of processes. Keys are
+    counted relative to the minimum key in a single `__parallel_pass`.
+
+    Return (sorted keys, order)
+           where `order` is the stable permutation which sorts the keys, or
+           None when return_order is False.
+
+    Complexity: O(n + p * k) work in total
+                where n is the size of keys, p is the number of workers and
+                k is the range of keys.
+    """
+    if not np.issubdtype(keys.dtype, np.integer):
+        raise ValueError("Keys should be integers.")
+    passes = []
+    if len(keys) > 1:
+        min_key, max_key = keys.min(), keys.max()
+        if min_key != max_key:
+            passes.append((min_key, 0, int(max_key) - int(min_key) + 1))
+    return __sort(keys, passes, workers, return_order)
+
+
+def __sort(
+    keys: np.ndarray, passes: list, workers: int, return_order: bool
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Sort keys by a sequence of stable passes, each of which is
+    (base, shift, number of buckets) and moves keys by their digits
+    (key - base) >> shift, masked to the number of buckets.
+
+    Keys, and the order when return_order is True, are double-buffered in
+    shared memory, and every pass moves them from one buffer to the other.
+    Only the first buffers are initialized, since each pass overwrites the
+    whole destination buffer.
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    n = len(keys)
+    arrays = {"keys0": keys, "keys1": ((n,), keys.dtype)}
+    if return_order:
+        order = np.arange(n, dtype=np.int64)
+        arrays.update({"order0": order, "order1": ((n,), order.dtype)})
+    with SharedArrays.create(arrays) as shared:
+        init_worker(shared.specs)  # The main process also runs tasks.
+        try:
+            if workers == 1 or not passes:
+                source = __run_passes(n, passes, 1, map)
+            else:
+                with get_context().Pool(
+                    workers, initializer=init_worker, initargs=(shared.specs,)
+                ) as pool:
+                    source = __run_passes(n, passes, workers, pool.map)
+        finally:
+            close_worker()
+        sorted_keys = shared[f"keys{source}"].copy()
+        order = shared[f"order{source}"].copy() if return_order else None
+    return (sorted_keys, order)
+
+
+def __run_passes(n: int, passes: list, workers: int, map_chunks) -> int:
+    """Run the passes and return the index of the buffer holding the
+    sorted keys.
+    """
+    bounds = np.linspace(0, n, workers + 1, dtype=np.int64).tolist()
+    chunks = [(s, e) for s, e in zip(bounds[:-1], bounds[1:]) if s < e]
+    source = 0
+    for spec in passes:
+        __parallel_pass(chunks, source, 1 - source, spec, map_chunks)
+        source = 1 - source
+    return source
+
+
+def __parallel_pass(
+    chunks: list, source: int, dest: int, spec: tuple, map_chunks
+) -> None:
+    """Move keys from the source buffer to the dest buffer, stably sorted
+    by their digits.
+
+    Each worker counts the digits of its chunk. The histograms are combined
+    by a prefix sum in digit-major, chunk-minor order into the offset of
+    each digit of each chunk in the output, and each worker then scatters
+    its chunk directly into the dest buffer from its offsets.
+    """
+    histograms = np.array(
+        list(map_chunks(__count_chunk, [(c, source, spec) for c in chunks]))
+    )
+    offsets = np.cumsum(histograms.T.ravel()) - histograms.T.ravel()
+    offsets = offsets.reshape(histograms.shape[::-1]).T
+    tasks = [
+        (c, source, dest, spec, offsets[i]) for i, c in enumerate(chunks)
+    ]
+    list(map_chunks(__scatter_chunk, tasks))
+
+
+def __get_digits(keys: np.ndarray, spec: tuple) -> np.ndarray:
+    base, shift, num_buckets = spec
+    mask = (1 << (num_buckets - 1).bit_length()) - 1
+    digits = ((keys - keys.dtype.type(base)) >> shift) & mask
+    for dtype in [np.uint8, np.uint16, np.uint32]:
+        if num_buckets - 1 <= np.iinfo(dtype).max:
+            return digits.astype(dtype)
+    return digits.astype(np.intp)
+
+
+def __count_chunk(task: tuple) -> np.ndarray:
+    (start, end), source, spec = task
+    keys = get_worker_state()[f"keys{source}"][start:end]
+    return np.bincount(__get_digits(keys, spec), minlength=spec[2])
+
+
+def __scatter_chunk(task: tuple) -> None:
+    (start, end), source, dest, spec, offsets = task
+    arrays = get_worker_state()
+    keys = arrays[f"keys{source}"][start:end]
+    digits = __get_digits(keys, spec)
+    # NumPy sorts integers of 16 bits or less stably by counting sort.
+    local_order = np.argsort(digits, kind="stable")
+    sorted_digits = digits[local_order]
+    counts = np.bincount(sorted_digits, minlength=spec[2])
+    local_starts = np.cumsum(counts) - counts
+    positions = (
+        offsets[sorted_digits]
+        + np.arange(end - start)
+        - local_starts[sorted_digits]
+    )
+    arrays[f"keys{dest}"][positions] = keys[local_order]
+    if "order0" in arrays:
+        order = arrays[f"order{source}"][start:end]
+        arrays[f"order{dest}"][positions] = order[local_order]
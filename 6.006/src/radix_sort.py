@@ -1,29 +1,149 @@
-from typing import Iterable
-import math
-from counting_sort import counting_sort
+from typing import Any, Callable, Iterable, Sequence
+import numpy as np
+from parallel_sort import parallel_radix_sort
 
+SIGN_BIT = np.uint64(1 << 63)
 
-def radix_sort(iterable: Iterable[int], max_key: int = None) -> Iterable[int]:
-    """Sort the iterable using radix sort algorithm.
 
-    Items of the iterable should be positive interger. Sorting iterable whose
-    item is other than positive integer is not implemented.
+def __to_unsigned(keys: np.ndarray) -> np.ndarray:
+    """Map integer keys to uint64 keeping their order. The sign bit of
+    signed integers is flipped so that negative keys precede positive ones.
+    """
+    if np.issubdtype(keys.dtype, np.unsignedinteger):
+        return keys.astype(np.uint64)
+    return keys.astype(np.int64).view(np.uint64) ^ SIGN_BIT
+
+
+def __from_unsigned(keys: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if np.issubdtype(dtype, np.unsignedinteger):
+        return keys.astype(dtype)
+    return (keys ^ SIGN_BIT).view(np.int64).astype(dtype)
+
 
-    Complexity: O(n)
-                when k < n^O(1) where k is the maximum key in iterable and
-                n is the size of the iterable.
+def __get_digit_width(n: int, num_bits: int) -> int:
+    """Return 16 when there are enough items to fill 2^16 buckets and keys
+    have more than 8 bits, otherwise 8.
     """
+    return 16 if num_bits > 8 and n >= 2**16 else 8
+
+
+def __sort_unsigned(keys: np.ndarray, return_order: bool):
+    """Sort uint64 keys and return (sorted keys, stable permutation of the
+    keys or None when return_order is False).
+    """
+    varying_bits = int(np.bitwise_or.reduce(keys ^ keys[0]))
+    width = __get_digit_width(len(keys), varying_bits.bit_length())
+    digit_dtype = np.uint16 if width == 16 else np.uint8
+    mask = (1 << width) - 1
+
+    order = np.arange(len(keys)) if return_order else None
+    for shift in range(0, varying_bits.bit_length(), width):
+        if (varying_bits >> shift) & mask == 0:
+            continue  # All keys have the same digit.
+        digits = (keys >> np.uint64(shift)).astype(digit_dtype)
+        # NumPy sorts integers of 16 bits or less stably by counting sort.
+        pass_order = np.argsort(digits, kind="stable")
+        keys = keys[pass_order]
+        if return_order:
+            order = order[pass_order]
+    return keys, order
+
+
+def __get_keys(
+    iterable: Iterable[Any], get_key: Callable[..., int]
+) -> np.ndarray:
+    if get_key is None:
+        keys = np.asarray(iterable)
+    else:
+        keys = np.array([get_key(item) for item in iterable])
+    if not np.issubdtype(keys.dtype, np.integer):
+        if keys.dtype == object and all(
+            isinstance(key, (int, np.integer)) for key in keys.tolist()
+        ):
+            raise ValueError("The iterable has keys out of the int64 range.")
+        raise ValueError("The iterable has non-integer keys.")
+    return keys
+
+
+def __to_sequence(iterable: Iterable[Any]) -> Sequence[Any]:
+    """Return the iterable itself when it can be indexed, otherwise its
+    items in a list.
+    """
+    if isinstance(iterable, (np.ndarray, Sequence)):
+        return iterable
+    return list(iterable)
+
+
+def __sort(keys: np.ndarray, workers: int, return_order: bool):
+    if workers == 1:
+        return __sort_unsigned(__to_unsigned(keys), return_order)
+    return parallel_radix_sort(__to_unsigned(keys), workers, return_order)
+
+
+def radix_sort(
+    iterable: Iterable[Any],
+    get_key: Callable[..., int] = None,
+    workers: int = 1,
+) -> Iterable[Any]:
+    """Sort the iterable by integer keys using LSD radix sort algorithm.
+
+    iterable -- An iterable to be sorted. The sorted items are returned in
+                an ndarray when it is an ndarray, otherwise in a list.
+    get_key -- A function that returns the key value from an item in the
+                iterable. Items themselves are keys when it is None.
+    workers -- The number of processes sorting keys in parallel, or None to
+                use all CPUs. See parallel_sort.parallel_radix_sort.
+
+    Keys are sorted by 8- or 16-bit digits from the least significant one,
+    with a stable counting sort per digit on NumPy arrays. Passes over
+    digits shared by all keys are skipped, so only the bits that vary
+    among keys are sorted. Negative integers are supported by flipping the
+    sign bit.
+
+    Raise ValueError when the iterable has non-integer keys.
+
+    Complexity: O(n * b / w)
+                where n is the size of the iterable, b is the number of bits
+                that vary among keys and w is the digit width.
+    """
+    iterable = __to_sequence(iterable)
     if len(iterable) < 2:
         return iterable
 
-    if max_key is None:
-        max_key = max(iterable)
+    if get_key is not None:
+        order = radix_argsort(iterable, get_key, workers)
+        if isinstance(iterable, np.ndarray):
+            return iterable[order]
+        return [iterable[i] for i in order.tolist()]
+
+    keys = __get_keys(iterable, None)
+    sorted_keys, _ = __sort(keys, workers, return_order=False)
+    sorted_keys = __from_unsigned(sorted_keys, keys.dtype)
+    if isinstance(iterable, np.ndarray):
+        return sorted_keys
+    return sorted_keys.tolist()
+
+
+def radix_argsort(
+    iterable: Iterable[Any],
+    get_key: Callable[..., int] = None,
+    workers: int = 1,
+) -> np.ndarray:
+    """Return the stable permutation of indices which sorts the iterable by
+    integer keys, using LSD radix sort algorithm as radix_sort.
 
-    n = len(iterable)
-    num_digits = int(math.log(max_key, n)) + 1
+    Keys are evaluated once into an array and only the indices are moved
+    while sorting, so the permutation can reorder several columns, e.g.
+    `array[order]` or `frame.iloc[order]`, without sorting them again.
 
-    for i in range(num_digits):
-        iterable = counting_sort(
-            iterable, get_key=lambda x, n=n, i=i: (x // (n ** i)) % n
-        )  # Key is (i+1)th digit of the integer in base n.
-    return iterable
+    Raise ValueError when the iterable has non-integer keys.
+
+    Complexity: O(n * b / w)
+                where n is the size of the iterable, b is the number of bits
+                that vary among keys and w is the digit width.
+    """
+    iterable = __to_sequence(iterable)
+    if len(iterable) < 2:
+        return np.arange(len(iterable))
+    _, order = __sort(__get_keys(iterable, get_key), workers, True)
+    return order
@@ -0,0 +1,118 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, Union
+import bisect
+import sys
+import time
+from graph import Graph, Vertex, WeightedEdge, strongly_connected_components
+
+
+class ReachabilityIndex:
+    """Precomputed index answering whether vertex u can reach vertex v.
+
+    Strongly connected components are condensed into a directed acyclic
+    graph (DAG), whose components are numbered in the postorder of Tarjan's
+    algorithm. A component can reach the components whose numbers fall in
+    its label, a sorted list of disjoint intervals. Descendants in the DFS
+    tree have consecutive numbers, so labels are compact in practice.
+
+    The index is rebuilt on demand when the graph is modified.
+    """
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.build()
+
+    def build(self) -> ReachabilityIndex:
+        """Build the index.
+
+        Complexity: O(|V| + |E| + Σ(label size of successors))
+        """
+        start_time = time.perf_counter()
+        components = strongly_connected_components(self.graph)
+        self.component = {}  # {vertex: component number}
+        for number, members in enumerate(components):
+            for vertex in members:
+                self.component[vertex] = number
+
+        # Components are in reverse topological order, so labels of all
+        # successors are ready before a component is labeled.
+        self.starts, self.ends = [], []
+        for number, members in enumerate(components):
+            intervals = [(number, number)]
+            successors = set()
+            for vertex in members:
+                for neighbor in self.graph.get_neighbors(vertex):
+                    successor = self.component[neighbor]
+                    if successor != number:
+                        successors.add(successor)
+            for successor in successors:
+                intervals.extend(
+                    zip(self.starts[successor], self.ends[successor])
+                )
+            starts, ends = self.__merge_intervals(intervals)
+            self.starts.append(starts)
+            self.ends.append(ends)
+
+        self.version = self.graph.version
+        self.build_time = time.perf_counter() - start_time
+        return self
+
+    def reachable(self, source: Vertex, dest: Vertex) -> bool:
+        """Return whether there is a path from source to dest.
+
+        Complexity: O(lg k)
+                    where k is the number of intervals in the label of the
+                    component of source.
+        """
+        if self.graph.version != self.version:
+            self.build()
+        number = self.component[dest]
+        starts = self.starts[self.component[source]]
+        i = bisect.bisect_right(starts, number) - 1
+        return i >= 0 and self.ends[self.component[source]][i] >= number
+
+    def add_edge(self, edge: WeightedEdge) -> ReachabilityIndex:
+        """Add the edge into the graph. The index stays valid without
+        rebuilding when the source already reaches the destination.
+        """
+        source, dest = edge.get_source(), edge.get_dest()
+        is_redundant = self.graph.version == self.version and self.reachable(
+            source, dest
+        )
+        self.graph.add_edge(edge)
+        if is_redundant:
+            self.version = self.graph.version
+        return self
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Return the build time in seconds, the number of components and
+        intervals and the estimated memory of the index in bytes.
+        """
+        num_intervals = sum(len(starts) for starts in self.starts)
+        memory = sys.getsizeof(self.component) + sum(
+            sys.getsizeof(starts) + sys.getsizeof(ends)
+            for starts, ends in zip(self.starts, self.ends)
+        )
+        return {
+            "build_time": self.build_time,
+            "components": len(self.starts),
+            "intervals": num_intervals,
+            "bytes": memory,
+        }
+
+    @staticmethod
+    def __merge_intervals(
+        intervals: List[Tuple[int, int]],
+    ) -> Tuple[List[int], List[int]]:
+        """Merge overlapping or adjacent intervals into sorted disjoint
+        intervals and return their (starts, ends).
+        """
+        intervals.sort()
+        starts, ends = [], []
+        for start, end in intervals:
+            if ends and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        return starts, ends
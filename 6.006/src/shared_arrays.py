@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple, Union
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+
+__worker_state = None
+
+
+class SharedArrays:
+    """NumPy arrays in blocks of shared memory, which other processes attach
+    by `specs`, {name: (block name, shape, dtype)}.
+
+    The process which creates the arrays unlinks the blocks on close, and
+    the processes which attach them only close them. Views of the arrays
+    should not be used after close.
+    """
+
+    def __init__(self, specs: dict, blocks: List[SharedMemory], owner: bool):
+        self.specs = specs
+        self.blocks = blocks
+        self.owner = owner
+        self.arrays = {
+            name: np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+            for (name, (_, shape, dtype)), block in zip(specs.items(), blocks)
+        }
+
+    @classmethod
+    def create(
+        cls, arrays: Dict[str, Union[np.ndarray, Tuple[tuple, np.dtype]]]
+    ) -> SharedArrays:
+        """Create shared arrays. An ndarray is copied into its block, while
+        a (shape, dtype) pair only allocates an array whose contents are
+        undefined.
+        """
+        specs, blocks = {}, []
+        try:
+            for name, array in arrays.items():
+                if isinstance(array, np.ndarray):
+                    shape, dtype = array.shape, array.dtype
+                else:
+                    shape, dtype = tuple(array[0]), np.dtype(array[1])
+                size = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+                block = SharedMemory(create=True, size=max(size, 1))
+                blocks.append(block)
+                specs[name] = (block.name, shape, dtype.str)
+        except BaseException:
+            for block in blocks:
+                block.close()
+                block.unlink()
+            raise
+        shared = cls(specs, blocks, owner=True)
+        for name, array in arrays.items():
+            if isinstance(array, np.ndarray):
+                shared[name][...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, specs: dict) -> SharedArrays:
+        """Attach the shared arrays created by another process."""
+        blocks = [SharedMemory(name=name) for name, _, _ in specs.values()]
+        return cls(specs, blocks, owner=False)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.arrays[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays
+
+    def close(self) -> None:
+        self.arrays = {}  # Release views before closing the blocks.
+        for block in self.blocks:
+            block.close()
+            if self.owner:
+                block.unlink()
+        self.blocks = []
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def get_context():
+    """Return the fork context where it is available, in which workers
+    inherit modules and arguments without pickling, otherwise the default
+    context.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def init_worker(
+    specs: dict, build_state: Callable[[SharedArrays], Any] = None
+) -> None:
+    """Attach the shared arrays in a worker process and keep
+    build_state(arrays) as its state, or the arrays when build_state is
+    None. The main process also calls it to run tasks by itself.
+    """
+    global __worker_state
+    arrays = SharedArrays.attach(specs)
+    state = arrays if build_state is None else build_state(arrays)
+    __worker_state = (state, arrays)
+
+
+def get_worker_state() -> Any:
+    return __worker_state[0]
+
+
+def close_worker() -> None:
+    global __worker_state
+    if __worker_state is not None:
+        arrays = __worker_state[1]
+        __worker_state = None  # Release the state before closing arrays.
+        arrays.close()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from typing import Tuple, Dict, Union
+from collections import OrderedDict
+import sys
+from graph import Graph, Vertex, dijkstra, bellman_ford
+
+
+class ShortestPathCache:
+    """Least recently used (LRU) cache of single-source shortest path results
+    of a graph, keyed by (source, algorithm).
+
+    All entries are dropped when the version of the graph changes, i.e. when
+    the graph is modified. Least recently used entries are evicted when the
+    estimated size of cached results exceeds `max_bytes`.
+
+    Results are shared with the cache and should not be modified.
+    """
+
+    ALGORITHMS = {"dijkstra": dijkstra, "bellman_ford": bellman_ford}
+
+    def __init__(self, graph: Graph, max_bytes: int = 64 * 2 ** 20):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # {(source, algorithm): (result, size)}
+        self.num_bytes = 0
+        self.version = graph.version
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def query(
+        self, source: Vertex, algorithm: str = "dijkstra"
+    ) -> Tuple[Dict[Vertex, Union[int, float], Dict[Vertex, Vertex]]]:
+        """Return (distance, parent) from the source computed by the
+        algorithm, from the cache if possible.
+
+        Complexity: O(1) for a cache hit.
+        """
+        if self.graph.version != self.version:
+            self.clear()
+            self.version = self.graph.version
+
+        key = (source, algorithm)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.misses += 1
+        result = self.ALGORITHMS[algorithm](self.graph, source)
+        size = self.estimate_size(result)
+        if size <= self.max_bytes:
+            self.entries[key] = (result, size)
+            self.num_bytes += size
+            while self.num_bytes > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.num_bytes -= evicted_size
+        return result
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.num_bytes = 0
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.entries),
+            "bytes": self.num_bytes,
+        }
+
+    @staticmethod
+    def estimate_size(result: tuple) -> int:
+        """Estimate memory used by a result: the dictionaries and the
+        distances, which are numbers computed for this result. Keys and
+        parents are not counted because they are vertices of the graph.
+
+        Complexity: O(V)
+        """
+        return (
+            sys.getsizeof(result)
+            + sum(sys.getsizeof(d) for d in result)
+            + sum(sys.getsizeof(value) for value in result[0].values())
+        )
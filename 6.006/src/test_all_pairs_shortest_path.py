@@ -0,0 +1,117 @@
+import random
+import math
+import multiprocessing.pool
+import pytest
+from graph import Graph, Vertex, WeightedEdge, bellman_ford
+from all_pairs_shortest_path import (
+    johnson,
+    floyd_warshall,
+    reconstruct_path,
+)
+
+
+class TestJohnson:
+    def build_random_graph(
+        self, random_graph, num_vertex: int, num_edge: int
+    ) -> Graph:
+        g, v = random_graph(num_vertex, num_edge, seed=6, min_weight=0)
+        random.seed(6)
+        potential = {vertex: random.randint(0, 5) for vertex in v}
+        # Weights of a cycle sum up to the sum of non-negative base weights,
+        # because potentials cancel out. So there is no negative cycle.
+        e = []
+        for edge in g.get_edges():
+            source, dest = edge.vertex_pair
+            weight = edge.get_weight() + potential[source] - potential[dest]
+            e.append(WeightedEdge((source, dest), weight))
+        return Graph(v, e)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_johnson(self, random_graph, workers):
+        g = self.build_random_graph(random_graph, 30, 120)
+        rows = dict(johnson(g, workers=workers))
+        assert set(rows) == g.get_vertices()
+        for source, distance in rows.items():
+            assert distance == bellman_ford(g, source)[0]
+
+    def test_rows_are_computed_on_demand(self, random_graph, monkeypatch):
+        g = self.build_random_graph(random_graph, 60, 200)
+        submitted = []
+        apply_async = multiprocessing.pool.Pool.apply_async
+
+        def counted_apply_async(pool, func, args=(), *rest, **kwargs):
+            submitted.append(len(args[0]))
+            return apply_async(pool, func, args, *rest, **kwargs)
+
+        monkeypatch.setattr(
+            multiprocessing.pool.Pool, "apply_async", counted_apply_async
+        )
+        rows = johnson(g, workers=2, chunksize=3)
+        next(rows)
+        # The chunk being consumed and at most 2 * workers chunks of
+        # chunksize rows in flight.
+        assert len(submitted) <= 5 and set(submitted) == {3}
+        assert len(list(rows)) == 59
+        assert sum(submitted) == 60
+
+    def test_csr_graph(self, random_graph):
+        g = self.build_random_graph(random_graph, 20, 60)
+        csr = g.to_csr()
+        for source, distance in johnson(csr, workers=1):
+            assert distance == bellman_ford(csr, source)[0]
+
+    def test_negative_cycle_should_raise_error(self):
+        v = [Vertex() for i in range(3)]
+        e = [
+            WeightedEdge((v[0], v[1]), 1),
+            WeightedEdge((v[1], v[2]), -3),
+            WeightedEdge((v[2], v[0]), 1),
+        ]
+        with pytest.raises(RuntimeError):
+            next(johnson(Graph(v, e), workers=1))
+
+
+class TestFloydWarshall:
+    build_random_graph = TestJohnson.build_random_graph
+
+    @pytest.mark.parametrize("cache_bytes", [1, 2 ** 18])
+    def test_floyd_warshall(self, random_graph, cache_bytes):
+        csr = self.build_random_graph(random_graph, 30, 150).to_csr()
+        distance, predecessor, labels = floyd_warshall(csr, cache_bytes)
+        assert labels == range(30)
+        for source, row in johnson(csr, workers=1):
+            assert distance[source].tolist() == [row[v] for v in range(30)]
+            for dest in range(30):
+                path = reconstruct_path(predecessor, source, dest)
+                if distance[source, dest] == math.inf:
+                    assert path == []
+                    continue
+                assert path[0] == source and path[-1] == dest
+                length = sum(
+                    csr.get_edge(u, v).get_weight()
+                    for u, v in zip(path, path[1:])
+                )
+                assert length == distance[source, dest]
+
+    def test_negative_cycle_should_raise_error(self):
+        v = [Vertex() for i in range(3)]
+        e = [
+            WeightedEdge((v[0], v[1]), 1),
+            WeightedEdge((v[1], v[2]), -3),
+            WeightedEdge((v[2], v[0]), 1),
+        ]
+        with pytest.raises(RuntimeError):
+            floyd_warshall(Graph(v, e).to_csr())
+
+    def test_graph(self, random_graph):
+        graph = self.build_random_graph(random_graph, 20, 60)
+        distance, predecessor, labels = floyd_warshall(graph)
+        index = {vertex: i for i, vertex in enumerate(labels)}
+        assert set(labels) == graph.get_vertices()
+        for source, row in johnson(graph, workers=1):
+            for dest, dist in row.items():
+                assert distance[index[source], index[dest]] == dist
+                path = reconstruct_path(
+                    predecessor, index[source], index[dest]
+                )
+                assert (path == []) == (dist == math.inf)
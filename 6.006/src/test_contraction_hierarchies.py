@@ -0,0 +1,107 @@
+import random
+import math
+import pytest
+from graph import Graph, Vertex, WeightedEdge, dijkstra
+from contraction_hierarchies import ContractionHierarchy
+
+
+class TestContractionHierarchy:
+    def build_road_like_graph(self, size: int) -> tuple:
+        """Grid with two-way roads of random lengths and some missing roads."""
+        random.seed(13)
+        v = {
+            (x, y): Vertex(f"{x},{y}")
+            for x in range(size)
+            for y in range(size)
+        }
+        e = []
+        for (x, y), vertex in v.items():
+            for neighbor in [(x + 1, y), (x, y + 1)]:
+                if neighbor in v and random.random() < 0.9:
+                    weight = random.randint(1, 20)
+                    e.append(WeightedEdge((vertex, v[neighbor]), weight))
+                    e.append(WeightedEdge((v[neighbor], vertex), weight))
+        return Graph(v.values(), e), list(v.values())
+
+    def check_path(self, g: Graph, path: list, distance):
+        length = 0
+        for u, v in zip(path, path[1:]):
+            length += g.get_edge(u, v).get_weight()
+        assert length == distance
+
+    def test_query(self):
+        g, v = self.build_road_like_graph(12)
+        hierarchy = ContractionHierarchy(g)
+        for i in range(30):
+            source, target = random.sample(v, 2)
+            distance, path = hierarchy.query(source, target)
+            expected_distance = dijkstra(g, source)[0][target]
+            assert distance == expected_distance
+            if distance == math.inf:
+                assert path == []
+            else:
+                assert path[0] is source and path[-1] is target
+                self.check_path(g, path, distance)
+
+        stats = hierarchy.get_stats()
+        assert stats["queries"] == 30
+        assert stats["shortcuts"] == len(hierarchy.via)
+        assert stats["preprocessing_time"] > 0
+        assert stats["average_query_time"] > 0
+
+    def test_augmented_graph(self):
+        g, v = self.build_road_like_graph(6)
+        hierarchy = ContractionHierarchy(g)
+        augmented = hierarchy.get_augmented_graph()
+        source = v[0]
+        assert dijkstra(augmented, source)[0] == dijkstra(g, source)[0]
+
+    def test_save_and_load(self, tmp_path):
+        g, v = self.build_road_like_graph(8)
+        csr = g.to_csr()
+        hierarchy = ContractionHierarchy(csr)
+        path = tmp_path / "hierarchy.npz"
+        hierarchy.save(path)
+        loaded = ContractionHierarchy.load(path)
+        for i in range(10):
+            source, target = random.sample(range(csr.num_vertices), 2)
+            assert loaded.query(source, target) == hierarchy.query(
+                source, target
+            )
+
+    def test_save_and_load_vertices(self, tmp_path):
+        g, v = self.build_road_like_graph(8)
+        hierarchy = ContractionHierarchy(g)
+        path = tmp_path / "hierarchy.npz"
+        hierarchy.save(path)
+        loaded = ContractionHierarchy.load(path)
+        for i in range(10):
+            source, target = random.sample(v, 2)
+            distance, vertices = hierarchy.query(source, target)
+            names = [vertex.name for vertex in vertices]
+            assert loaded.query(source.name, target.name) == (distance, names)
+
+        hierarchy.labels[0] = object()
+        with pytest.raises(ValueError):
+            hierarchy.save(path)
+
+    def test_save_ambiguous_vertices_should_raise_error(self, tmp_path):
+        path = tmp_path / "hierarchy.npz"
+        v = [Vertex("A"), Vertex("A"), Vertex("B")]
+        e = [WeightedEdge((v[0], v[2]), 1), WeightedEdge((v[1], v[2]), 5)]
+        with pytest.raises(ValueError):
+            ContractionHierarchy(Graph(v, e)).save(path)
+
+        g = Graph([0, 1, "a"], [WeightedEdge((0, 1), 1)])
+        with pytest.raises(ValueError):
+            ContractionHierarchy(g).save(path)
+
+        g = Graph([0, 1, 2], [WeightedEdge((0, 1), 1)])
+        ContractionHierarchy(g).save(path)
+        assert ContractionHierarchy.load(path).query(0, 1) == (1, [0, 1])
+
+    def test_negative_weight_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), -1)])
+        with pytest.raises(ValueError):
+            ContractionHierarchy(g)
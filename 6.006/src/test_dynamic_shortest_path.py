@@ -0,0 +1,48 @@
+import random
+import pytest
+from graph import Graph, Vertex, WeightedEdge, dijkstra
+from dynamic_shortest_path import DynamicShortestPath
+
+
+class TestDynamicShortestPath:
+    def check_result(self, g: Graph, dynamic: DynamicShortestPath):
+        distance, parent = dynamic.get_result()
+        assert distance == dijkstra(g, dynamic.source)[0]
+        assert parent[dynamic.source] is None
+        for vertex, parent_vertex in parent.items():
+            if parent_vertex is not None:
+                weight = g.get_edge(parent_vertex, vertex).get_weight()
+                assert distance[parent_vertex] + weight == distance[vertex]
+
+    def test_random_updates(self, random_graph):
+        random.seed(7)
+        g, v = random_graph(60, 150, seed=7, min_weight=0)
+        dynamic = DynamicShortestPath(g, v[0], *dijkstra(g, v[0]))
+        for i in range(200):
+            source, dest = random.sample(v, 2)
+            if g.get_edge(source, dest) is not None and random.random() < 0.2:
+                dynamic.remove_edge(source, dest)
+            else:
+                dynamic.update_edge(source, dest, random.randint(0, 12))
+            self.check_result(g, dynamic)
+
+    def test_changed_vertices(self):
+        v = [Vertex() for i in range(4)]
+        e = [
+            WeightedEdge((v[0], v[1]), 1),
+            WeightedEdge((v[1], v[2]), 1),
+            WeightedEdge((v[0], v[3]), 9),
+        ]
+        g = Graph(v, e)
+        dynamic = DynamicShortestPath(g, v[0])
+        assert dynamic.update_edge(v[0], v[1], 3) == {v[1], v[2]}
+        assert dynamic.update_edge(v[2], v[3], 1) == {v[3]}
+        assert dynamic.update_edge(v[0], v[3], 20) == set()
+        assert dynamic.remove_edge(v[1], v[2]) == {v[2], v[3]}
+        self.check_result(g, dynamic)
+
+    def test_negative_weight_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), 1)])
+        with pytest.raises(ValueError):
+            DynamicShortestPath(g, v[0]).update_edge(v[0], v[1], -1)
@@ -0,0 +1,44 @@
+import pytest
+import numpy as np
+from external_sort import external_radix_sort
+
+
+class TestExternalRadixSort:
+    @pytest.mark.parametrize("memory_bytes", [2**20, 2**14])
+    def test_sort_file(self, tmp_path, memory_bytes):
+        array = np.random.randint(-(2**40), 2**40, size=20000)
+        array.tofile(tmp_path / "input")
+        stats = external_radix_sort(
+            tmp_path / "input",
+            tmp_path / "output",
+            memory_bytes=memory_bytes,
+            block_bytes=2**10,
+            temp_dir=tmp_path,
+        )
+        sorted_array = np.fromfile(tmp_path / "output", dtype=np.int64)
+        assert np.array_equal(sorted_array, np.sort(array))
+        assert stats["bytes"] == array.nbytes
+        assert (stats["runs"] == 1) == (memory_bytes == 2**20)
+        assert stats["bytes_per_second"] > 0
+        files = sorted(path.name for path in tmp_path.iterdir())
+        assert files == ["input", "output"]
+
+    def test_sort_file_with_many_duplicates(self, tmp_path):
+        array = np.random.randint(0, 5, size=3000).astype(np.uint32)
+        array.tofile(tmp_path / "input")
+        stats = external_radix_sort(
+            tmp_path / "input",
+            tmp_path / "output",
+            dtype=np.uint32,
+            memory_bytes=2**10,
+            block_bytes=64,
+        )
+        sorted_array = np.fromfile(tmp_path / "output", dtype=np.uint32)
+        assert np.array_equal(sorted_array, np.sort(array))
+        assert stats["runs"] > 1
+
+    def test_sort_empty_file(self, tmp_path):
+        (tmp_path / "input").touch()
+        stats = external_radix_sort(tmp_path / "input", tmp_path / "output")
+        assert (tmp_path / "output").stat().st_size == 0
+        assert stats["bytes"] == 0
@@ -1,18 +1,38 @@
+from typing import Tuple
+import math
+import random
 import pytest
+import numpy as np
+from heap import MinPriorityQueue
 from graph import (
     Graph,
+    CSRGraph,
     Vertex,
     WeightedEdge,
     breadth_first_search,
     depth_first_search,
+    topological_sort,
+    strongly_connected_components,
     dijkstra,
     bellman_ford,
+    shortest_path,
+    bidirectional_dijkstra,
+    a_star,
+    EDGE_RECORD_DTYPE,
 )
 
 
 class TestDirectedGraph:
     # TODO: Do tests with more comprehensive test cases.
 
+    def test_slots(self):
+        vertex = Vertex("A")
+        edge = WeightedEdge((vertex, vertex), 1)
+        with pytest.raises(AttributeError):
+            vertex.color = "white"
+        with pytest.raises(AttributeError):
+            edge.color = "white"
+
     def test_build_graph(self):
         num_vertex = 10
         v = [Vertex() for i in range(num_vertex)]
@@ -67,7 +87,76 @@ class TestDirectedGraph:
         finished = depth_first_search(g, v[0])
         assert finished == [v[1], v[5], v[2], v[4], v[3], v[0]]
 
-    def test_dijkstra(self):
+    def test_depth_first_search_long_path(self):
+        num_vertex = 20000
+        v = [Vertex() for i in range(num_vertex)]
+        e = [WeightedEdge((v[i], v[i + 1]), 1) for i in range(num_vertex - 1)]
+        g = Graph(v, e)
+        finished = depth_first_search(g, v[0])
+        assert finished == v[::-1]
+
+    def test_topological_sort(self):
+        random.seed(3)
+        v = [Vertex() for i in range(100)]
+        pairs = set()
+        while len(pairs) < 300:
+            i, j = sorted(random.sample(range(100), 2))
+            pairs.add((i, j))
+        e = [WeightedEdge((v[i], v[j]), 1) for i, j in pairs]
+        g = Graph(v, e)
+        order = topological_sort(g)
+        position = {vertex: i for i, vertex in enumerate(order)}
+        assert len(order) == len(v)
+        for edge in g.get_edges():
+            assert position[edge.get_source()] < position[edge.get_dest()]
+
+    def test_topological_sort_cycle_should_raise_error(self):
+        v = [Vertex() for i in range(3)]
+        e = [
+            WeightedEdge((v[0], v[1]), 1),
+            WeightedEdge((v[1], v[2]), 1),
+            WeightedEdge((v[2], v[0]), 1),
+        ]
+        with pytest.raises(ValueError):
+            topological_sort(Graph(v, e))
+
+    def test_strongly_connected_components(self):
+        """ A ← B → C
+            ↓ ↘ ↑ ↗ ↓
+            D → E   F
+        """
+        v = [Vertex(name) for name in "ABCDEF"]
+        e = [
+            WeightedEdge((v[0], v[3]), 1),
+            WeightedEdge((v[0], v[4]), 1),
+            WeightedEdge((v[1], v[0]), 1),
+            WeightedEdge((v[1], v[2]), 1),
+            WeightedEdge((v[2], v[5]), 1),
+            WeightedEdge((v[3], v[4]), 1),
+            WeightedEdge((v[4], v[1]), 1),
+            WeightedEdge((v[4], v[2]), 1),
+        ]
+        components = strongly_connected_components(Graph(v, e))
+        assert [set(c) for c in components] == [
+            {v[5]},
+            {v[2]},
+            {v[0], v[1], v[3], v[4]},
+        ]
+
+    def test_strongly_connected_components_long_cycle(self):
+        num_vertex = 20000
+        v = [Vertex() for i in range(num_vertex)]
+        e = [
+            WeightedEdge((v[i], v[(i + 1) % num_vertex]), 1)
+            for i in range(num_vertex)
+        ]
+        components = strongly_connected_components(Graph(v, e))
+        assert len(components) == 1 and len(components[0]) == num_vertex
+
+    @pytest.mark.parametrize(
+        "priority_queue", ["array", "binary_heap", "lazy_heap", "bucket"]
+    )
+    def test_dijkstra(self, priority_queue):
         """C → → → → → D → +
            ↓ ↖       ↗ ↓   ↓
            ↓   A → B   ↙   ↓
@@ -87,7 +176,7 @@ class TestDirectedGraph:
             WeightedEdge((v[4], v[5]), 1),  # E -> F
         ]
         g = Graph(v, e)
-        distance, parent = dijkstra(g, v[0])
+        distance, parent = dijkstra(g, v[0], priority_queue)
 
         dist_ans = {v[0]: 0, v[1]: 10, v[2]: 20, v[3]: 40, v[4]: 20, v[5]: 21}
         parent_ans = {
@@ -101,7 +190,34 @@ class TestDirectedGraph:
         assert dist_ans == distance
         assert parent_ans == parent
 
-    def test_bellman_ford(self):
+    def test_dijkstra_priority_queues_agree(self):
+        random.seed(0)
+        v = [Vertex() for i in range(200)]
+        pairs = set(
+            (random.randrange(200), random.randrange(200)) for i in range(1000)
+        )
+        e = [
+            WeightedEdge((v[i], v[j]), random.randint(0, 9)) for i, j in pairs
+        ]
+        g = Graph(v, e)
+        distance, _ = dijkstra(g, v[0], "array")
+        for priority_queue in ["binary_heap", "lazy_heap", "bucket"]:
+            assert dijkstra(g, v[0], priority_queue)[0] == distance
+
+    def test_dijkstra_bucket_non_integer_weight_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), 1.5)])
+        with pytest.raises(ValueError):
+            dijkstra(g, v[0], "bucket")
+
+    def test_dijkstra_unknown_priority_queue_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), 1)])
+        with pytest.raises(ValueError):
+            dijkstra(g, v[0], "fibonacci_heap")
+
+    @pytest.mark.parametrize("mode", ["rounds", "spfa", "numpy"])
+    def test_bellman_ford(self, mode):
         """ A ← B → C
             ↓ ↘ ↑ ↗ ↓
             D → E   F
@@ -118,7 +234,7 @@ class TestDirectedGraph:
             WeightedEdge((v[4], v[2]), 4),
         ]
         g = Graph(v, e)
-        distance, parent = bellman_ford(g, v[0])
+        distance, parent = bellman_ford(g, v[0], mode)
         dist_ans = {v[0]: 0, v[1]: 4, v[2]: 9, v[3]: -1, v[4]: 6, v[5]: 8}
         parent_ans = {
             v[0]: None,
@@ -131,7 +247,8 @@ class TestDirectedGraph:
         assert dist_ans == distance
         assert parent_ans == parent
 
-    def test_bellman_ford_negative_cycle(self):
+    @pytest.mark.parametrize("mode", ["rounds", "spfa", "numpy"])
+    def test_bellman_ford_negative_cycle(self, mode):
         """ A ← B → C
             ↓ ↘ ↑ ↗ ↓
             D → E   F
@@ -150,4 +267,355 @@ class TestDirectedGraph:
         ]
         g = Graph(v, e)
         with pytest.raises(RuntimeError):
-            distance, parent = bellman_ford(g, v[0])
+            distance, parent = bellman_ford(g, v[0], mode)
+
+    def test_duplicate_edge_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        e = [WeightedEdge((v[0], v[1]), 1), WeightedEdge((v[0], v[1]), 2)]
+        with pytest.raises(ValueError):
+            Graph(v, e)
+
+    def test_get_edge(self):
+        v = [Vertex() for i in range(3)]
+        e = [WeightedEdge((v[0], v[1]), 1), WeightedEdge((v[0], v[2]), 2)]
+        g = Graph(v, e)
+        assert g.get_edge(v[0], v[2]) is e[1]
+        assert g.get_edge(v[1], v[0]) is None
+        assert set(g.get_neighbors(v[0])) == {v[1], v[2]}
+        assert dict(g.get_weighted_neighbors(v[0])) == {v[1]: 1, v[2]: 2}
+
+    def test_add_and_remove_edges(self):
+        v = [Vertex() for i in range(3)]
+        g = Graph(v[:2], [WeightedEdge((v[0], v[1]), 1)])
+        g.add_vertex(v[2])
+        assert v[2] in g.get_vertices()
+
+        g.add_edge(WeightedEdge((v[1], v[2]), -1))
+        assert g.is_non_neg_weight_graph is False
+        assert len(g.get_edges()) == 2
+        with pytest.raises(ValueError):
+            g.add_edge(WeightedEdge((v[1], v[2]), 3))
+
+        removed = g.remove_edge(v[1], v[2])
+        assert removed.get_weight() == -1
+        assert g.is_non_neg_weight_graph is True
+        assert g.get_edge(v[1], v[2]) is None
+        with pytest.raises(KeyError):
+            g.remove_edge(v[1], v[2])
+
+    def test_bellman_ford_modes_agree(self):
+        random.seed(4)
+        v = [Vertex() for i in range(100)]
+        pairs = set()
+        while len(pairs) < 400:
+            i, j = sorted(random.sample(range(100), 2))
+            pairs.add((i, j))
+        # Negative weights without cycles: all edges go to larger indices.
+        e = [
+            WeightedEdge((v[i], v[j]), random.randint(-5, 9))
+            for i, j in pairs
+        ]
+        g = Graph(v, e)
+        distance, _ = bellman_ford(g, v[0], "rounds")
+        for mode in ["spfa", "numpy"]:
+            mode_distance, parent = bellman_ford(g, v[0], mode)
+            assert mode_distance == distance
+            for vertex, parent_vertex in parent.items():
+                if parent_vertex is not None:
+                    weight = g.get_edge(parent_vertex, vertex).get_weight()
+                    assert distance[parent_vertex] + weight == distance[vertex]
+
+    def test_bellman_ford_unknown_mode_should_raise_error(self):
+        v = [Vertex() for i in range(2)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), 1)])
+        with pytest.raises(ValueError):
+            bellman_ford(g, v[0], "dijkstra")
+
+
+class TestPointToPointShortestPath:
+    def build_grid_graph(self, size: int) -> Tuple[Graph, dict]:
+        random.seed(5)
+        v = {
+            (x, y): Vertex(f"{x},{y}")
+            for x in range(size)
+            for y in range(size)
+        }
+        e = []
+        for (x, y), vertex in v.items():
+            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+                if (x + dx, y + dy) in v:
+                    weight = random.randint(1, 9)
+                    e.append(WeightedEdge((vertex, v[x + dx, y + dy]), weight))
+        return Graph(v.values(), e), v
+
+    def check_path(self, g: Graph, path: list, distance: int):
+        length = 0
+        for u, v in zip(path, path[1:]):
+            length += g.get_edge(u, v).get_weight()
+        assert length == distance
+
+    def test_point_to_point_shortest_path(self):
+        g, v = self.build_grid_graph(15)
+        source = v[0, 0]
+        all_distance, _ = dijkstra(g, source)
+
+        def heuristic(vertex):  # Every weight is at least 1
+            x, y = map(int, vertex.name.split(","))
+            return abs(x - 14) + abs(y - 14)
+
+        for target in [v[14, 14], v[7, 3], v[0, 0], v[0, 1]]:
+            for distance, path in [
+                shortest_path(g, source, target),
+                bidirectional_dijkstra(g, source, target),
+                a_star(g, source, target, heuristic),
+            ]:
+                path = list(path)
+                assert distance == all_distance[target]
+                assert path[0] is source and path[-1] is target
+                self.check_path(g, path, distance)
+
+    def test_unreachable_target(self):
+        v = [Vertex() for i in range(3)]
+        g = Graph(v, [WeightedEdge((v[0], v[1]), 1)])
+        for distance, path in [
+            shortest_path(g, v[0], v[2]),
+            bidirectional_dijkstra(g, v[0], v[2]),
+            a_star(g, v[0], v[2], lambda vertex: 0),
+        ]:
+            assert distance == math.inf
+            assert list(path) == []
+
+    def test_csr_graph(self):
+        g, v = self.build_grid_graph(10)
+        csr = g.to_csr()
+        source, target = csr.labels.index(v[0, 0]), csr.labels.index(v[9, 5])
+        distance, _ = shortest_path(g, v[0, 0], v[9, 5])
+        csr_distance, path = bidirectional_dijkstra(csr, source, target)
+        assert csr_distance == distance
+        path = list(path)
+        assert path[0] == source and path[-1] == target
+
+
+class TestCSRGraph:
+    def build_graph(self) -> Graph:
+        """ A ← B → C
+            ↓ ↘ ↑ ↗ ↓
+            D → E   F
+        """
+        v = [Vertex(name) for name in "ABCDEF"]
+        e = [
+            WeightedEdge((v[0], v[3]), 1),
+            WeightedEdge((v[0], v[4]), 9),
+            WeightedEdge((v[1], v[0]), 3),
+            WeightedEdge((v[1], v[2]), 5),
+            WeightedEdge((v[2], v[5]), 1),
+            WeightedEdge((v[3], v[4]), 7),
+            WeightedEdge((v[4], v[1]), 2),
+            WeightedEdge((v[4], v[2]), 4),
+        ]
+        return Graph(v, e)
+
+    def test_to_csr(self):
+        g = self.build_graph()
+        csr = g.to_csr()
+        assert csr.num_vertices == 6
+        assert len(csr.indices) == len(g.get_edges())
+        assert csr.indptr.dtype == np.int64
+        assert csr.indices.dtype == np.int32
+        assert csr.weights.dtype == np.float64
+        for edge in g.get_edges():
+            u = csr.labels.index(edge.get_source())
+            v = csr.labels.index(edge.get_dest())
+            assert csr.get_edge(u, v).get_weight() == edge.get_weight()
+
+    def test_vertex_ids(self):
+        g = self.build_graph()
+        csr = g.to_csr()
+        for vertex in g.get_vertices():
+            assert csr.get_label(csr.get_vertex_id(vertex)) is vertex
+
+    def test_array_results(self, random_graph):
+        g, _ = random_graph(100, 300, seed=9, min_weight=0)
+        csr = g.to_csr()
+        distance, parent = dijkstra(csr, 0)
+        for priority_queue in ["binary_heap", "lazy_heap", "bucket"]:
+            distance_array, parent_array = dijkstra(
+                csr, 0, priority_queue, as_arrays=True
+            )
+            assert distance_array.dtype == np.float64
+            assert parent_array.dtype == np.int64
+            assert distance_array.tolist() == [
+                distance[v] for v in range(100)
+            ]
+            for v in range(1, 100):
+                if parent_array[v] >= 0:
+                    u = parent_array[v]
+                    weight = csr.get_edge(u, v).get_weight()
+                    assert distance_array[u] + weight == distance_array[v]
+                else:
+                    assert distance_array[v] == math.inf
+        for mode in ["rounds", "spfa", "numpy"]:
+            distance_array, _ = bellman_ford(csr, 0, mode, as_arrays=True)
+            assert distance_array.tolist() == [
+                distance[v] for v in range(100)
+            ]
+
+        level, parent_array = breadth_first_search(csr, 0, as_arrays=True)
+        parent = breadth_first_search(csr, 0)
+        assert set(np.flatnonzero(level >= 0).tolist()) == set(parent)
+        assert parent_array[0] == -1 and level[0] == 0
+
+    def test_array_results_use_the_priority_queue(
+        self, random_graph, monkeypatch
+    ):
+        g, _ = random_graph(50, 150, seed=3)
+        csr = g.to_csr()
+        extracted = []
+        extract_min = MinPriorityQueue.extract_min
+
+        def counted_extract_min(queue):
+            extracted.append(1)
+            return extract_min(queue)
+
+        monkeypatch.setattr(
+            MinPriorityQueue, "extract_min", counted_extract_min
+        )
+        lazy_distance, _ = dijkstra(csr, 0, as_arrays=True)
+        assert len(extracted) == 0
+        heap_distance, _ = dijkstra(csr, 0, "binary_heap", as_arrays=True)
+        assert len(extracted) > 0
+        assert heap_distance.tolist() == lazy_distance.tolist()
+
+    def test_array_results_of_graph_should_raise_error(self):
+        g = self.build_graph()
+        source = next(iter(g.get_vertices()))
+        with pytest.raises(TypeError):
+            dijkstra(g, source, as_arrays=True)
+
+    def test_mismatched_arrays_should_raise_error(self):
+        with pytest.raises(ValueError):
+            CSRGraph([0, 1, 2], [1, 0], [1.0])
+
+    def test_breadth_first_search(self, random_graph):
+        random.seed(1)
+        for i in range(20):
+            g, _ = random_graph(50, 120, seed=i)
+            csr = g.to_csr()
+            source = random.randrange(50)
+            parent = breadth_first_search(csr, source)
+            # Same as the sequential search over the same adjacency order
+            sequential_parent = {source: None}
+            frontiers = [source]
+            for frontier in frontiers:
+                for neighbor in csr.get_neighbors(frontier):
+                    if neighbor not in sequential_parent:
+                        sequential_parent[neighbor] = frontier
+                        frontiers.append(neighbor)
+            assert parent == sequential_parent
+
+    def test_shortest_paths(self, random_graph):
+        g, _ = random_graph(100, 400, seed=2, min_weight=0)
+        csr = g.to_csr()
+        distance, _ = dijkstra(g, csr.labels[0])
+        csr_distance, csr_parent = dijkstra(csr, 0)
+        assert dijkstra(csr, 0, "bucket")[0] == csr_distance
+        assert csr_distance == {
+            i: distance[vertex] for i, vertex in enumerate(csr.labels)
+        }
+        for mode in ["rounds", "spfa", "numpy"]:
+            assert bellman_ford(csr, 0, mode)[0] == csr_distance
+
+    def test_depth_first_search(self):
+        g = self.build_graph()
+        csr = g.to_csr()
+        source = [v.name for v in csr.labels].index("A")
+        finished = depth_first_search(csr, source)
+        assert sorted(finished) == list(range(6))
+        assert finished[-1] == source
+
+
+class TestEdgeFile:
+    edges = [(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 1), (2, 3, 5), (3, 0, 3)]
+
+    def write_text_file(self, path, delimiter: str):
+        lines = ["# source, dest, weight"]
+        lines += [delimiter.join(map(str, edge)) for edge in self.edges]
+        path.write_text("\n".join(lines) + "\n\n")
+
+    def write_binary_file(self, path):
+        records = np.array(self.edges, dtype=EDGE_RECORD_DTYPE)
+        records.tofile(path)
+
+    def check_csr(self, csr: CSRGraph):
+        assert csr.num_vertices == 4
+        assert len(csr.indices) == len(self.edges)
+        for u, v, weight in self.edges:
+            assert csr.get_edge(u, v).get_weight() == weight
+        # Edges from a vertex keep their order in the file.
+        assert csr.get_neighbors(0) == [1, 2]
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 100])
+    def test_csr_from_text_file(self, tmp_path, chunk_size):
+        for format, delimiter in [("csv", ","), ("tsv", "\t")]:
+            path = tmp_path / f"edges.{format}"
+            self.write_text_file(path, delimiter)
+            csr = CSRGraph.from_edge_file(path, format, chunk_size)
+            self.check_csr(csr)
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 100])
+    def test_csr_from_binary_file(self, tmp_path, chunk_size):
+        path = tmp_path / "edges.bin"
+        self.write_binary_file(path)
+        self.check_csr(CSRGraph.from_edge_file(path, "binary", chunk_size))
+
+    def test_graph_from_edge_file(self, tmp_path):
+        path = tmp_path / "edges.bin"
+        self.write_binary_file(path)
+        g = Graph.from_edge_file(path, "binary", chunk_size=4)
+        assert g.get_vertices() == {0, 1, 2, 3}
+        assert len(g.get_edges()) == len(self.edges)
+        distance, _ = dijkstra(g, 0)
+        assert distance == {0: 0, 1: 3, 2: 1, 3: 4}
+        # Edge objects are created only on request.
+        assert all(len(edges) == 0 for edges in g.adj_edges.values())
+        edge = g.remove_edge(0, 2)
+        assert edge.vertex_pair == (0, 2) and edge.get_weight() == 1
+        assert g.get_edge(0, 2) is None and 2 not in g.get_neighbors(0)
+
+    @pytest.mark.parametrize("chunk_size", [1, 100])
+    def test_duplicate_edges_should_raise_error(self, tmp_path, chunk_size):
+        path = tmp_path / "edges.csv"
+        path.write_text("0,1,1\n1,2,1\n0,1,2\n")
+        with pytest.raises(ValueError):
+            Graph.from_edge_file(path, chunk_size=chunk_size)
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_file(path, chunk_size=chunk_size)
+
+    def test_num_vertices(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("0,1,1\n1,2,1\n")
+        assert CSRGraph.from_edge_file(path, num_vertices=5).num_vertices == 5
+        g = Graph.from_edge_file(path, num_vertices=5)
+        assert g.get_vertices() == set(range(5))
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_file(path, num_vertices=2)
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_arrays([0], [2], [1.0], num_vertices=2)
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("# no edges\n")
+        assert CSRGraph.from_edge_file(path).num_vertices == 0
+        assert len(Graph.from_edge_file(path).get_vertices()) == 0
+
+    def test_unweighted_text_file(self, tmp_path):
+        path = tmp_path / "edges.csv"
+        path.write_text("0,1\n1,2\n")
+        g = Graph.from_edge_file(path)
+        assert g.get_edge(1, 2).get_weight() == 1
+
+    def test_unknown_format_should_raise_error(self, tmp_path):
+        path = tmp_path / "edges.txt"
+        path.write_text("0 1 1\n")
+        with pytest.raises(ValueError):
+            CSRGraph.from_edge_file(path, "txt")
@@ -0,0 +1,78 @@
+import os
+import pytest
+import numpy as np
+from graph import Graph, CSRGraph, dijkstra
+from graph_generators import (
+    grid_edges,
+    erdos_renyi_edges,
+    power_law_edges,
+    road_like_edges,
+    generate_graph,
+)
+
+
+class TestGraphGenerators:
+    def check_edges(self, edges, num_vertices: int):
+        sources, dests, weights = edges
+        assert len(sources) == len(dests) == len(weights)
+        assert np.all((sources >= 0) & (sources < num_vertices))
+        assert np.all((dests >= 0) & (dests < num_vertices))
+        assert np.all(sources != dests)
+        assert np.all(weights >= 1)
+        keys = sources * num_vertices + dests
+        assert len(np.unique(keys)) == len(keys)  # No duplicate edges
+
+    def test_generators(self):
+        self.check_edges(grid_edges(50), 50)
+        self.check_edges(erdos_renyi_edges(50, 300), 50)
+        self.check_edges(power_law_edges(200, 1000), 200)
+        self.check_edges(road_like_edges(100), 100)
+        assert len(erdos_renyi_edges(50, 300)[0]) == 300
+        assert len(grid_edges(100)[0]) == 2 * 2 * 10 * 9
+
+    def test_deterministic(self):
+        for generate in [
+            lambda seed: erdos_renyi_edges(100, 500, seed),
+            lambda seed: power_law_edges(100, 500, seed),
+            lambda seed: road_like_edges(100, seed),
+        ]:
+            for a, b in zip(generate(1), generate(1)):
+                assert np.array_equal(a, b)
+            assert not all(
+                np.array_equal(a, b) for a, b in zip(generate(1), generate(2))
+            )
+
+    def test_power_law_degree(self):
+        sources, _, _ = power_law_edges(2000, 8000)
+        degrees = np.bincount(sources)
+        assert degrees.max() > 10 * np.median(degrees)
+
+    def test_generate_graph_with_cache(self, tmp_path):
+        g = generate_graph("road_like", 100, cache_dir=tmp_path)
+        assert isinstance(g, Graph)
+        assert len(os.listdir(tmp_path)) == 1
+        csr = generate_graph("road_like", 100, cache_dir=tmp_path, as_csr=True)
+        assert isinstance(csr, CSRGraph)
+        assert len(os.listdir(tmp_path)) == 1
+        uncached = generate_graph("road_like", 100)
+        assert dijkstra(g, 0)[0] == dijkstra(uncached, 0)[0]
+        assert dijkstra(csr, 0)[0] == dijkstra(uncached, 0)[0]
+
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_isolated_vertices_are_kept(self, tmp_path, cached):
+        # Vertex 42 has no roads with this seed.
+        cache_dir = tmp_path if cached else None
+        g = generate_graph("road_like", 100, seed=1, cache_dir=cache_dir)
+        csr = generate_graph(
+            "road_like", 100, seed=1, cache_dir=cache_dir, as_csr=True
+        )
+        assert g.get_vertices() == set(range(100))
+        assert 42 in g.get_vertices() and len(g.get_neighbors(42)) == 0
+        assert csr.num_vertices == 100
+
+        sparse = generate_graph("erdos_renyi", 50, 10, cache_dir=cache_dir)
+        assert len(sparse.get_vertices()) == 50
+
+    def test_unknown_kind_should_raise_error(self):
+        with pytest.raises(ValueError):
+            generate_graph("complete", 10)
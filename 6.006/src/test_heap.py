@@ -1,7 +1,8 @@
 from __future__ import annotations
 import math
 import random
-from heap import MaxHeap
+import pytest
+from heap import MaxHeap, MinPriorityQueue
 
 
 class TestMaxHeap:
@@ -51,3 +52,35 @@ class TestMaxHeap:
         random_numbers = [random.randint(0, 10) for i in range(50)]
         heap = MaxHeap(random_numbers)
         assert heap.sort() == sorted(random_numbers, reverse=True)
+
+
+class TestMinPriorityQueue:
+    def test_extract_min(self):
+        random_numbers = [random.randint(0, 100) for i in range(50)]
+        queue = MinPriorityQueue()
+        for i, key in enumerate(random_numbers):
+            queue.insert(i, key)
+        keys = [queue.extract_min()[1] for i in range(len(random_numbers))]
+        assert keys == sorted(random_numbers)
+        assert len(queue) == 0
+
+    def test_decrease_key(self):
+        queue = MinPriorityQueue()
+        for i in range(10):
+            queue.insert(f"item{i}", i + 10)
+        queue.decrease_key("item7", 3)
+        queue.decrease_key("item4", 5)
+        assert queue.get_key("item7") == 3
+        assert queue.extract_min() == ("item7", 3)
+        assert queue.extract_min() == ("item4", 5)
+        assert queue.extract_min() == ("item0", 10)
+        assert "item7" not in queue and "item1" in queue
+
+    def test_increase_key_should_raise_error(self):
+        queue = MinPriorityQueue().insert("a", 1)
+        with pytest.raises(ValueError):
+            queue.decrease_key("a", 2)
+
+    def test_extract_from_empty_queue_should_raise_error(self):
+        with pytest.raises(IndexError):
+            MinPriorityQueue().extract_min()
@@ -0,0 +1,29 @@
+import numpy as np
+from graph import breadth_first_search
+from multi_source_bfs import multi_source_breadth_first_search
+
+
+class TestMultiSourceBreadthFirstSearch:
+    def test_levels(self, random_graph):
+        csr = random_graph(150, 250, seed=10)[0].to_csr()
+        sources = list(range(0, 150, 2))  # More than 64 sources
+        level = multi_source_breadth_first_search(csr, sources)
+        assert level.shape == (len(sources), 150)
+        for i, source in enumerate(sources):
+            expected_level, _ = breadth_first_search(
+                csr, source, as_arrays=True
+            )
+            assert level[i].tolist() == expected_level.tolist()
+
+    def test_reachability_bitsets(self, random_graph):
+        csr = random_graph(100, 150, seed=10)[0].to_csr()
+        sources = [5, 17, 42, 99, 5]
+        bitsets = multi_source_breadth_first_search(
+            csr, sources, return_levels=False
+        )
+        assert bitsets.shape == (100, 1) and bitsets.dtype == np.uint64
+        for i, source in enumerate(sources):
+            reachable = set(breadth_first_search(csr, source))
+            for v in range(100):
+                bit = (int(bitsets[v, i // 64]) >> (i % 64)) & 1
+                assert bit == (v in reachable)
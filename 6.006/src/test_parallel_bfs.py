@@ -0,0 +1,22 @@
+import pytest
+import numpy as np
+from graph import breadth_first_search
+from parallel_bfs import parallel_breadth_first_search
+
+
+class TestParallelBreadthFirstSearch:
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parallel_breadth_first_search(self, random_graph, workers):
+        csr = random_graph(300, 600, seed=8)[0].to_csr()
+        level, parent = parallel_breadth_first_search(csr, 0, workers)
+        expected_parent = breadth_first_search(csr, 0)
+
+        assert level[0] == 0 and parent[0] == -1
+        assert set(np.flatnonzero(level >= 0)) == set(expected_parent)
+        for v, u in expected_parent.items():
+            if u is not None:
+                # Any vertex one level closer to the source is a parent.
+                assert csr.get_edge(parent[v], v) is not None
+                assert level[v] == level[u] + 1
+                assert level[v] == level[parent[v]] + 1
+        assert np.all(parent[level < 0] == -1)
@@ -0,0 +1,39 @@
+import pytest
+import numpy as np
+from parallel_sort import parallel_radix_sort, parallel_counting_sort
+
+
+class TestParallelSort:
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parallel_radix_sort(self, workers):
+        keys = np.random.randint(0, 2**40, size=5000).astype(np.uint64)
+        sorted_keys, order = parallel_radix_sort(keys, workers, True)
+        assert np.array_equal(sorted_keys, np.sort(keys))
+        assert np.array_equal(order, np.argsort(keys, kind="stable"))
+
+        sorted_keys, order = parallel_radix_sort(keys, workers)
+        assert np.array_equal(sorted_keys, np.sort(keys)) and order is None
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parallel_radix_sort_with_16bit_digits(self, workers):
+        keys = np.random.randint(0, 2**36, size=2**17).astype(np.uint64)
+        sorted_keys, _ = parallel_radix_sort(keys, workers)
+        assert np.array_equal(sorted_keys, np.sort(keys))
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parallel_counting_sort(self, workers):
+        # Many equal keys check stability across chunks.
+        keys = np.random.randint(1000, 1100, size=5000)
+        sorted_keys, order = parallel_counting_sort(keys, workers, True)
+        assert np.array_equal(sorted_keys, np.sort(keys))
+        assert np.array_equal(order, np.argsort(keys, kind="stable"))
+
+    def test_trivial_inputs(self):
+        keys = np.array([], dtype=np.uint64)
+        assert len(parallel_radix_sort(keys, 2)[0]) == 0
+        sorted_keys, order = parallel_counting_sort(np.full(5, 7), 2, True)
+        assert list(sorted_keys) == [7] * 5 and list(order) == list(range(5))
+
+    def test_signed_keys_should_raise_error(self):
+        with pytest.raises(ValueError):
+            parallel_radix_sort(np.array([-1, 2]))
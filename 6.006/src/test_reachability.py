@@ -0,0 +1,45 @@
+import random
+from graph import Graph, Vertex, WeightedEdge, breadth_first_search
+from reachability import ReachabilityIndex
+
+
+class TestReachabilityIndex:
+    def check_index(self, g: Graph, index: ReachabilityIndex):
+        for u in g.get_vertices():
+            reachable = breadth_first_search(g, u)
+            for v in g.get_vertices():
+                assert index.reachable(u, v) == (v in reachable)
+
+    def test_reachable(self, random_graph):
+        g, v = random_graph(80, 120, seed=11)
+        index = ReachabilityIndex(g)
+        self.check_index(g, index)
+        stats = index.get_stats()
+        assert stats["components"] <= 80
+        assert stats["intervals"] >= stats["components"]
+        assert stats["build_time"] >= 0 and stats["bytes"] > 0
+
+    def test_rebuild_when_graph_is_modified(self, random_graph):
+        random.seed(12)
+        g, v = random_graph(40, 50, seed=12)
+        index = ReachabilityIndex(g)
+        for i in range(20):
+            source, dest = random.sample(v, 2)
+            if g.get_edge(source, dest) is None:
+                index.add_edge(WeightedEdge((source, dest), 1))
+        self.check_index(g, index)
+
+        source, dest = next(iter(g.get_edges())).vertex_pair
+        g.remove_edge(source, dest)
+        self.check_index(g, index)
+
+    def test_redundant_edge_keeps_index(self):
+        v = [Vertex() for i in range(3)]
+        e = [WeightedEdge((v[0], v[1]), 1), WeightedEdge((v[1], v[2]), 1)]
+        g = Graph(v, e)
+        index = ReachabilityIndex(g)
+        build_time = index.build_time
+        index.add_edge(WeightedEdge((v[0], v[2]), 1))
+        assert index.version == g.version
+        assert index.reachable(v[0], v[2]) and not index.reachable(v[2], v[0])
+        assert index.build_time == build_time
@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+from multiprocessing.shared_memory import SharedMemory
+from shared_arrays import (
+    SharedArrays,
+    get_context,
+    init_worker,
+    get_worker_state,
+    close_worker,
+)
+
+
+def fill_squares(specs: dict) -> None:
+    init_worker(specs)
+    try:
+        arrays = get_worker_state()
+        arrays["squares"][:] = arrays["values"] ** 2
+    finally:
+        close_worker()
+
+
+class TestSharedArrays:
+    def test_create_and_attach(self):
+        values = np.arange(10, dtype=np.int64)
+        arrays = {"values": values, "squares": ((10,), np.int64)}
+        with SharedArrays.create(arrays) as shared:
+            assert np.array_equal(shared["values"], values)
+            assert shared["squares"].shape == (10,) and "squares" in shared
+            process = get_context().Process(
+                target=fill_squares, args=(shared.specs,)
+            )
+            process.start()
+            process.join()
+            assert process.exitcode == 0
+            assert np.array_equal(shared["squares"], values**2)
+            block_name = shared.specs["values"][0]
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=block_name)
+
+    def test_worker_state(self):
+        with SharedArrays.create({"values": np.arange(3)}) as shared:
+            init_worker(shared.specs, lambda arrays: arrays["values"].sum())
+            assert get_worker_state() == 3
+            close_worker()
+            close_worker()  # Closing twice does nothing.
+
+    def test_empty_array(self):
+        with SharedArrays.create({"empty": np.zeros(0)}) as shared:
+            assert len(shared["empty"]) == 0
@@ -0,0 +1,68 @@
+import pytest
+import tracemalloc
+from graph import Graph, Vertex, WeightedEdge, dijkstra
+from graph_generators import generate_graph
+from shortest_path_cache import ShortestPathCache
+
+
+class TestShortestPathCache:
+    def build_graph(self) -> Graph:
+        # A cycle, so results from all sources have the same size.
+        v = [Vertex() for i in range(10)]
+        e = [WeightedEdge((v[i], v[(i + 1) % 10]), i) for i in range(10)]
+        return Graph(v, e)
+
+    def test_cache_hit(self):
+        g = self.build_graph()
+        cache = ShortestPathCache(g)
+        source = next(iter(g.get_vertices()))
+        result = cache.query(source)
+        assert result == dijkstra(g, source)
+        assert cache.query(source) is result
+        assert cache.query(source, "bellman_ford") is not result
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 2
+        assert stats["entries"] == 2 and stats["bytes"] > 0
+
+    def test_invalidate_when_graph_is_modified(self):
+        g = self.build_graph()
+        cache = ShortestPathCache(g)
+        u, v = Vertex(), Vertex()
+        source = next(iter(g.get_vertices()))
+        result = cache.query(source)
+        g.add_vertex(u).add_vertex(v).add_edge(WeightedEdge((source, u), 1))
+        new_result = cache.query(source)
+        assert new_result is not result
+        assert new_result[0][u] == 1
+        assert cache.get_stats()["misses"] == 2
+
+    def test_lru_eviction(self):
+        g = self.build_graph()
+        vertices = list(g.get_vertices())
+        size = ShortestPathCache.estimate_size(dijkstra(g, vertices[0]))
+        cache = ShortestPathCache(g, max_bytes=2 * size)
+        first = cache.query(vertices[0])
+        cache.query(vertices[1])
+        cache.query(vertices[0])  # vertices[1] is now least recently used
+        cache.query(vertices[2])
+        assert len(cache) == 2
+        assert cache.query(vertices[0]) is first
+        assert cache.get_stats()["misses"] == 3
+        assert cache.num_bytes <= cache.max_bytes
+
+    def test_estimate_size_is_close_to_measured_size(self):
+        g = generate_graph("road_like", 2000)
+        source = next(iter(g.get_vertices()))
+        tracemalloc.start()
+        try:
+            result = dijkstra(g, source)
+            measured = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        size = ShortestPathCache.estimate_size(result)
+        assert 0.8 * measured <= size <= 1.2 * measured
+
+    def test_unknown_algorithm_should_raise_error(self):
+        g = self.build_graph()
+        with pytest.raises(ValueError):
+            ShortestPathCache(g).query(next(iter(g.get_vertices())), "bfs")
@@ -1,7 +1,8 @@
 import pytest
 import numpy as np
-from counting_sort import counting_sort
-from radix_sort import radix_sort
+import counting_sort as counting_sort_module
+from counting_sort import counting_sort, counting_argsort
+from radix_sort import radix_sort, radix_argsort
 
 
 class TestCountingSort:
@@ -34,6 +35,62 @@ class TestCountingSort:
         sorted_tuples = [(a["key"], a["position"]) for a in sorted_array]
         assert sorted_tuples == sorted(tuples)
 
+    def test_sort_ndarray(self):
+        array = np.random.randint(0, 1000, size=5000)
+        sorted_array = counting_sort(array)
+        assert isinstance(sorted_array, np.ndarray)
+        assert sorted_array.dtype == array.dtype
+        assert np.array_equal(sorted_array, np.sort(array))
+
+        array = array.astype(np.uint16)
+        assert np.array_equal(counting_sort(array), np.sort(array))
+
+    def test_stable_sort_structured_array(self):
+        array = np.zeros(1000, dtype=[("key", np.int64), ("position", int)])
+        array["key"] = np.random.randint(0, 20, size=1000)
+        array["position"] = np.arange(1000)
+        sorted_array = counting_sort(array, get_key=lambda x: x["key"])
+        assert isinstance(sorted_array, np.ndarray)
+        assert np.array_equal(
+            sorted_array, np.sort(array, order=["key", "position"])
+        )
+
+    def test_sort_keys_in_narrow_range(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("Fell back to radix sort.")
+
+        monkeypatch.setattr(counting_sort_module, "radix_sort", fail)
+        monkeypatch.setattr(counting_sort_module, "radix_argsort", fail)
+        # Counts are allocated only for the range of keys.
+        array = np.random.randint(1_700_000_000, 1_700_001_000, size=1000)
+        sorted_array = counting_sort(array, max_bytes=4096)
+        assert np.array_equal(sorted_array, np.sort(array))
+        sorted_list = counting_sort(array.tolist(), max_bytes=4096)
+        assert sorted_list == sorted(array.tolist())
+
+        array = array.astype(np.uint64)
+        assert np.array_equal(counting_sort(array), np.sort(array))
+
+    def test_fall_back_to_radix_sort(self):
+        keys = np.random.randint(0, 2**40, size=100).tolist()
+        array = [{"key": keys[i % 50], "position": i} for i in range(100)]
+        sorted_array = counting_sort(
+            array, get_key=lambda x: x["key"], max_bytes=2**10
+        )
+        tuples = [(a["key"], a["position"]) for a in array]
+        sorted_tuples = [(a["key"], a["position"]) for a in sorted_array]
+        assert sorted_tuples == sorted(tuples)
+
+        array = np.array(keys)
+        assert np.array_equal(counting_sort(array), np.sort(array))
+
+    def test_parallel_sort(self):
+        keys = np.random.randint(0, 50, size=2000)
+        array = [(keys[i], i) for i in range(2000)]
+        sorted_array = counting_sort(array, lambda x: x[0], workers=2)
+        assert sorted_array == sorted(array)
+        assert np.array_equal(counting_sort(keys, workers=2), np.sort(keys))
+
 
 class TestRadixSort:
     def test_sort_base10(self):
@@ -51,3 +108,99 @@ class TestRadixSort:
         array = np.random.randint(0, 5 * n, size=n)
         sorted_array = radix_sort(array)
         assert list(sorted_array) == sorted(array)
+
+    def test_sort_negative_integers(self):
+        array = [5, -3, 2, -(2**63), 2**63 - 1, 0, -3]
+        assert radix_sort(array) == sorted(array)
+
+    def test_sort_ndarray_of_various_dtypes(self):
+        for dtype in [np.int8, np.uint16, np.int32, np.int64, np.uint64]:
+            info = np.iinfo(dtype)
+            array = np.random.randint(info.min, info.max, 1000, dtype=dtype)
+            sorted_array = radix_sort(array)
+            assert sorted_array.dtype == dtype
+            assert np.array_equal(sorted_array, np.sort(array))
+
+    def test_sort_with_16bit_digits(self):
+        # Keys share their high digits, whose passes are skipped.
+        array = np.random.randint(0, 2**20, size=2**17) + 10**15
+        assert np.array_equal(radix_sort(array), np.sort(array))
+
+    def test_stable_sort_with_key(self):
+        keys = np.random.randint(-1000, 1000, size=300).tolist()
+        array = [(keys[i], i) for i in range(300)]
+        assert radix_sort(array, get_key=lambda x: x[0]) == sorted(array)
+
+    def test_parallel_sort(self):
+        keys = np.random.randint(-(2**40), 2**40, size=2000)
+        array = [(keys[i], i) for i in range(2000)]
+        assert radix_sort(array, lambda x: x[0], workers=2) == sorted(array)
+        assert np.array_equal(radix_sort(keys, workers=2), np.sort(keys))
+
+    def test_non_integer_items_should_raise_error(self):
+        with pytest.raises(ValueError):
+            radix_sort([1.5, 2, 0])
+
+
+class TestIterableInput:
+    @pytest.mark.parametrize("sort", [counting_sort, radix_sort])
+    def test_sort_non_sequence_iterables(self, sort):
+        assert sort({3, 1, 2}) == [1, 2, 3]
+        assert sort({5: "a", 4: "b"}.keys()) == [4, 5]
+        records = {(2, "b"), (1, "a")}
+        assert sort(records, get_key=lambda x: x[0]) == [(1, "a"), (2, "b")]
+
+    @pytest.mark.parametrize("argsort", [counting_argsort, radix_argsort])
+    def test_argsort_non_sequence_iterables(self, argsort):
+        assert argsort(range(3, 0, -1)).tolist() == [2, 1, 0]
+        assert argsort({7}).tolist() == [0]
+
+    @pytest.mark.parametrize("sort", [counting_sort, radix_sort])
+    def test_keys_out_of_range_should_raise_error(self, sort):
+        with pytest.raises(ValueError, match="int64 range"):
+            sort([2**70, 1])
+        with pytest.raises(ValueError, match="non-integer"):
+            sort({1.5, 2})
+
+
+class TestArgsort:
+    @pytest.mark.parametrize("argsort", [counting_argsort, radix_argsort])
+    @pytest.mark.parametrize("max_key", [30, 2**20])
+    def test_stable_permutation(self, argsort, max_key):
+        # Draw from a few distinct keys so that the range has ties.
+        keys = np.random.choice(np.random.randint(0, max_key, 20), 1000)
+        order = argsort(keys)
+        assert np.array_equal(order, np.argsort(keys, kind="stable"))
+        assert len(argsort([])) == 0
+
+    def test_counting_argsort_in_narrow_range(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("Fell back to radix_argsort.")
+
+        monkeypatch.setattr(counting_sort_module, "radix_argsort", fail)
+        keys = np.random.randint(10**12, 10**12 + 2**17, size=5000)
+        order = counting_argsort(keys, max_bytes=2**20)
+        assert np.array_equal(order, np.argsort(keys, kind="stable"))
+
+    @pytest.mark.parametrize("argsort", [counting_argsort, radix_argsort])
+    def test_keys_are_evaluated_once(self, argsort):
+        records = [{"key": k} for k in np.random.randint(0, 50, 200).tolist()]
+        calls = []
+
+        def get_key(record):
+            calls.append(record)
+            return record["key"]
+
+        order = argsort(records, get_key)
+        assert len(calls) == len(records)
+        keys = [record["key"] for record in records]
+        assert [keys[i] for i in order] == sorted(keys)
+
+    @pytest.mark.parametrize("argsort", [counting_argsort, radix_argsort])
+    def test_reorder_columns(self, argsort):
+        array = np.zeros(500, dtype=[("key", np.int64), ("value", float)])
+        array["key"] = np.random.choice(10**6, size=500, replace=False)
+        array["value"] = np.random.rand(500)
+        order = argsort(array["key"])
+        sorted_array = array[order]
+        assert np.array_equal(sorted_array, np.sort(array, order="key"))
@@ -0,0 +1,164 @@
+import random
+import pytest
+from graph import Graph, Vertex, WeightedEdge, breadth_first_search
+from union_find import UnionFind, ConnectivityIndex, kruskal
+
+
+def get_undirected_graph(g: Graph) -> Graph:
+    undirected = Graph(g.get_vertices(), [])
+    for edge in g.get_edges():
+        u, v = edge.vertex_pair
+        for source, dest in [(u, v), (v, u)]:
+            if undirected.get_edge(source, dest) is None:
+                undirected.add_edge(WeightedEdge((source, dest), 1))
+    return undirected
+
+
+class TestUnionFind:
+    def test_union_and_find(self):
+        sets = UnionFind(6)
+        assert sets.union(0, 1)
+        assert sets.union(2, 3)
+        assert sets.union(1, 3)
+        assert not sets.union(0, 2)
+        assert sets.connected(0, 3)
+        assert not sets.connected(0, 4)
+        assert sets.num_sets == 3
+        roots = sets.get_roots()
+        assert len(set(roots[:4])) == 1
+        assert len(set(roots)) == 3
+
+    def test_add(self):
+        sets = UnionFind()
+        for i in range(10):
+            assert sets.add() == i
+        for i in range(9):
+            sets.union(i, i + 1)
+        assert len(sets) == 10 and sets.num_sets == 1
+        with pytest.raises(IndexError):
+            sets.find(10)
+
+
+class TestConnectivityIndex:
+    def check_index(self, g: Graph, index: ConnectivityIndex):
+        undirected = get_undirected_graph(g)
+        for u in g.get_vertices():
+            reachable = breadth_first_search(undirected, u)
+            for v in g.get_vertices():
+                assert index.connected(u, v) == (v in reachable)
+
+    def test_connected(self, random_graph):
+        g, v = random_graph(60, 40, seed=21, max_weight=20)
+        index = ConnectivityIndex(g)
+        self.check_index(g, index)
+        components = index.get_components()
+        assert len(components) == index.get_num_components()
+        assert sum(len(c) for c in components) == 60
+
+    def test_incremental_addition(self, random_graph):
+        random.seed(22)
+        g, v = random_graph(40, 20, seed=22, max_weight=20)
+        index = ConnectivityIndex(g)
+        for i in range(5):
+            vertex = Vertex()
+            index.add_vertex(vertex)
+            v.append(vertex)
+        for i in range(15):
+            source, dest = random.sample(v, 2)
+            if g.get_edge(source, dest) is None:
+                index.add_edge(WeightedEdge((source, dest), 1))
+        assert index.version == g.version
+        self.check_index(g, index)
+
+    def test_add_existing_vertex(self, random_graph):
+        g, v = random_graph(20, 25, seed=25, max_weight=20)
+        index = ConnectivityIndex(g)
+        num_components = index.get_num_components()
+        for vertex in v:
+            index.add_vertex(vertex)
+        assert index.version == g.version
+        assert index.get_num_components() == num_components
+        self.check_index(g, index)
+
+    def test_rebuild_when_graph_is_modified(self, random_graph):
+        g, v = random_graph(30, 30, seed=23, max_weight=20)
+        index = ConnectivityIndex(g)
+        source, dest = next(iter(g.get_edges())).vertex_pair
+        g.remove_edge(source, dest)
+        self.check_index(g, index)
+
+    def test_csr_graph(self, random_graph):
+        g, v = random_graph(50, 35, seed=24, max_weight=20)
+        csr = g.to_csr()
+        index = ConnectivityIndex(csr)
+        expected = ConnectivityIndex(g)
+        for i in range(50):
+            for j in range(50):
+                assert index.connected(i, j) == expected.connected(
+                    csr.get_label(i), csr.get_label(j)
+                )
+        with pytest.raises(TypeError):
+            index.add_vertex(50)
+        with pytest.raises(TypeError):
+            index.add_edge(WeightedEdge((0, 1), 1))
+
+
+class TestKruskal:
+    def get_forest_weight(self, forest: list) -> int:
+        return sum(edge.get_weight() for edge in forest)
+
+    def test_minimum_spanning_tree(self):
+        #       1     2
+        #   a ----- b ----- c
+        #   |     / |
+        # 4 |  3/   | 5
+        #   | /     |
+        #   d ----- e
+        #       6
+        v = [Vertex(name) for name in "abcde"]
+        a, b, c, d, e = v
+        edges = [
+            WeightedEdge((a, b), 1),
+            WeightedEdge((b, c), 2),
+            WeightedEdge((a, d), 4),
+            WeightedEdge((d, b), 3),
+            WeightedEdge((b, e), 5),
+            WeightedEdge((d, e), 6),
+        ]
+        forest = kruskal(Graph(v, edges))
+        assert self.get_forest_weight(forest) == 11
+        assert {edge.vertex_pair for edge in forest} == {
+            (a, b),
+            (b, c),
+            (d, b),
+            (b, e),
+        }
+
+    def test_random_graph(self, random_graph):
+        g, v = random_graph(40, 30, seed=25, max_weight=20)
+        forest = kruskal(g)
+        index = ConnectivityIndex(g)
+        assert len(forest) == 40 - index.get_num_components()
+
+        # Brute force: no edge outside the forest is lighter than the
+        # heaviest edge on the forest path between its endpoints.
+        tree = Graph(v, [])
+        for edge in forest:
+            u, w = edge.vertex_pair
+            tree.add_edge(WeightedEdge((u, w), edge.get_weight()))
+            tree.add_edge(WeightedEdge((w, u), edge.get_weight()))
+        for edge in g.get_edges():
+            u, w = edge.vertex_pair
+            stack, heaviest = [u], {u: 0}
+            while stack:
+                x = stack.pop()
+                for y, weight in tree.get_weighted_neighbors(x):
+                    if y not in heaviest:
+                        heaviest[y] = max(heaviest[x], weight)
+                        stack.append(y)
+            assert heaviest[w] <= edge.get_weight()
+
+        csr_forest = kruskal(g.to_csr())
+        assert self.get_forest_weight(csr_forest) == self.get_forest_weight(
+            forest
+        )
@@ -0,0 +1,232 @@
+from __future__ import annotations
+from typing import List, Union
+import numpy as np
+from graph import Graph, CSRGraph, Vertex, WeightedEdge
+
+
+class UnionFind:
+    """Disjoint-set forest over the integers 0, 1, ..., n - 1 with union by
+    rank and path compression, whose parents and ranks are stored in NumPy
+    arrays.
+
+    Complexity of find and union is O(α(n)) amortized, where α is the
+    inverse Ackermann function.
+    """
+
+    def __init__(self, num_elements: int = 0):
+        capacity = max(num_elements, 1)
+        self.parent = np.arange(capacity, dtype=np.int64)
+        self.rank = np.zeros(capacity, dtype=np.uint8)
+        self.num_elements = num_elements
+        self.num_sets = num_elements
+
+    def __len__(self):
+        return self.num_elements
+
+    def add(self) -> int:
+        """Add a new singleton set and return its element.
+
+        Complexity: O(1) amortized
+        """
+        if self.num_elements == len(self.parent):
+            capacity = 2 * len(self.parent)
+            self.parent = np.concatenate(
+                (
+                    self.parent,
+                    np.arange(len(self.parent), capacity, dtype=np.int64),
+                )
+            )
+            self.rank = np.concatenate(
+                (self.rank, np.zeros(capacity - len(self.rank), np.uint8))
+            )
+        self.num_elements += 1
+        self.num_sets += 1
+        return self.num_elements - 1
+
+    def find(self, x: int) -> int:
+        """Return the representative of the set containing x.
+
+        Raise IndexError when x is not an element.
+        """
+        if not 0 <= x < self.num_elements:
+            raise IndexError(f"{x} is not an element.")
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # Path compression
+            parent[x], x = root, parent[x]
+        return int(root)
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets containing x and y. Return False when they are
+        already in the same set.
+        """
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return False
+        if self.rank[x] < self.rank[y]:
+            x, y = y, x
+        self.parent[y] = x
+        if self.rank[x] == self.rank[y]:
+            self.rank[x] += 1
+        self.num_sets -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        """Return whether x and y are in the same set."""
+        return self.find(x) == self.find(y)
+
+    def get_roots(self) -> np.ndarray:
+        """Return the representative of every element, and compress all
+        paths so that every element points directly to its representative.
+
+        Complexity: O(n lg n)
+                    with vectorized pointer jumping.
+        """
+        parent = self.parent[: self.num_elements]
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent.copy()
+            parent[:] = grandparent
+
+
+class ConnectivityIndex:
+    """Weakly connected components of a graph, answering whether two
+    vertices are connected ignoring the direction of edges.
+
+    The index is built in one pass over the edges and stays valid when
+    vertices and edges are added through it. It is rebuilt on demand when
+    the graph is modified otherwise, since a disjoint-set forest cannot
+    split sets on edge removal.
+    """
+
+    def __init__(self, graph: Union[Graph, CSRGraph]):
+        self.graph = graph
+        self.build()
+
+    def build(self) -> ConnectivityIndex:
+        """Build the index.
+
+        Complexity: O(|V| + |E|α(|V|))
+        """
+        if isinstance(self.graph, CSRGraph):
+            self.id = None
+            self.sets = UnionFind(self.graph.num_vertices)
+            sources, dests, _ = self.graph.get_edge_arrays()
+            edges = zip(sources.tolist(), dests.tolist())
+        else:
+            self.id = {}  # {vertex: element of the disjoint-set forest}
+            vertices = self.graph.get_vertices()
+            self.sets = UnionFind(len(vertices))
+            for vertex in vertices:
+                self.id[vertex] = len(self.id)
+            edges = (
+                (self.id[edge.get_source()], self.id[edge.get_dest()])
+                for edge in self.graph.get_edges()
+            )
+        for u, v in edges:
+            self.sets.union(u, v)
+        self.version = self.graph.version
+        return self
+
+    def connected(self, u: Vertex, v: Vertex) -> bool:
+        """Return whether there is a path between u and v ignoring the
+        direction of edges.
+
+        Complexity: O(α(|V|)) amortized
+        """
+        if self.graph.version != self.version:
+            self.build()
+        return self.sets.connected(self.__get_id(u), self.__get_id(v))
+
+    def add_vertex(self, vertex: Vertex) -> ConnectivityIndex:
+        """Add the vertex into the graph. Do nothing if it already exists.
+
+        Raise TypeError when the graph is a CSRGraph, which is immutable.
+        """
+        self.__check_mutable()
+        if vertex in self.graph.adj_weights:
+            return self
+        is_valid = self.graph.version == self.version
+        self.graph.add_vertex(vertex)
+        if is_valid:
+            self.id[vertex] = self.sets.add()
+            self.version = self.graph.version
+        return self
+
+    def add_edge(self, edge: WeightedEdge) -> ConnectivityIndex:
+        """Add the edge into the graph and merge the components of its
+        endpoints without rebuilding.
+
+        Raise TypeError when the graph is a CSRGraph, which is immutable.
+        """
+        self.__check_mutable()
+        is_valid = self.graph.version == self.version
+        self.graph.add_edge(edge)
+        if is_valid:
+            self.sets.union(
+                self.__get_id(edge.get_source()),
+                self.__get_id(edge.get_dest()),
+            )
+            self.version = self.graph.version
+        return self
+
+    def get_num_components(self) -> int:
+        """Return the number of weakly connected components."""
+        if self.graph.version != self.version:
+            self.build()
+        return self.sets.num_sets
+
+    def get_components(self) -> List[List[Vertex]]:
+        """Return the vertices of each component."""
+        if self.graph.version != self.version:
+            self.build()
+        labels = (
+            range(self.graph.num_vertices) if self.id is None else self.id
+        )
+        roots = self.sets.get_roots().tolist()
+        components = {}  # {root: vertices in the component}
+        for label, root in zip(labels, roots):
+            components.setdefault(root, []).append(label)
+        return list(components.values())
+
+    def __check_mutable(self) -> None:
+        if isinstance(self.graph, CSRGraph):
+            raise TypeError(
+                "A CSRGraph is immutable, index a Graph to add vertices "
+                "or edges."
+            )
+
+    def __get_id(self, vertex: Vertex) -> int:
+        return vertex if self.id is None else self.id[vertex]
+
+
+def kruskal(graph: Union[Graph, CSRGraph]) -> List[WeightedEdge]:
+    """Return the edges of a minimum spanning forest of the graph whose
+    edges are regarded as undirected.
+
+    Complexity: O(|E|lg|E|)
+    """
+    if isinstance(graph, CSRGraph):
+        num_vertices, id = graph.num_vertices, None
+    else:
+        vertices = graph.get_vertices()
+        num_vertices = len(vertices)
+        id = {vertex: i for i, vertex in enumerate(vertices)}
+
+    edges = graph.get_edges()
+    weights = np.fromiter(
+        (edge.get_weight() for edge in edges), np.float64, len(edges)
+    )
+    sets = UnionFind(num_vertices)
+    forest = []
+    for i in np.argsort(weights, kind="stable").tolist():
+        if sets.num_sets == 1:
+            break
+        edge = edges[i]
+        u, v = edge.get_source(), edge.get_dest()
+        if sets.union(*((u, v) if id is None else (id[u], id[v]))):
+            forest.append(edge)
+    return forest